@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Any
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -276,7 +277,7 @@ class MultiTimeframeAnalyzer:
             )
 
             # Validate and clean
-            self._data = self.validator.process(raw_data)
+            self._data = self.validator.process(raw_data, self.symbol)
 
             logger.info(f"Fetched {len(self._data)} bars for {self.symbol}")
             return self._data
@@ -410,6 +411,9 @@ class MultiTimeframeAnalyzer:
         """Safely convert value, handling NaN."""
         if pd.isna(value):
             return None
+        if isinstance(value, np.generic):
+            # numpy scalars (e.g. unsigned volume) → plain Python numbers
+            value = value.item()
         if isinstance(value, float):
             return round(value, 4)
         return value
@@ -5,18 +5,30 @@ Validates market data before processing to catch issues early
 and provide clear error messages.
 """
 
+import threading
 import pandas as pd
 import numpy as np
-from typing import Set, Tuple
+from collections import OrderedDict
+from typing import Any, FrozenSet, Tuple
 from logging_config import get_logger
 from exceptions import DataValidationError, InsufficientDataError
 
 logger = get_logger()
 
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 
 # ============ CONSTANTS ============
 
-REQUIRED_COLUMNS: Set[str] = {"Open", "High", "Low", "Close", "Volume"}
+# Fixed OHLCV order for column-block checks (a set has no stable order)
+_REQUIRED_COLUMNS_TUPLE: Tuple[str, ...] = ("Open", "High", "Low", "Close", "Volume")
+
+REQUIRED_COLUMNS: FrozenSet[str] = frozenset(_REQUIRED_COLUMNS_TUPLE)
 
 MIN_BARS_FOR_ANALYSIS = 50
 MIN_BARS_FOR_INDICATORS = {
@@ -29,6 +41,67 @@ MIN_BARS_FOR_INDICATORS = {
     "adx_14": 14,
 }
 
+# Number of (symbol, bars, last timestamp) fingerprints remembered by
+# DataValidationPipeline to skip re-validating the same window
+VALIDATION_CACHE_SIZE = 256
+
+
+# ============ SCAN KERNEL ============
+
+
+def _scan_ohlcv_numpy(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Reduce an (N, 5) OHLCV block to the values the validator checks.
+
+    Args:
+        a: float64 array with columns in `_REQUIRED_COLUMNS_TUPLE` order.
+
+    Returns:
+        Tuple of (all-NaN flag per column, any-negative flag per column,
+        number of bars with High < Low). NaN never counts as negative.
+    """
+    if a.shape[0] == 0:
+        return np.ones(a.shape[1], dtype=bool), np.zeros(a.shape[1], dtype=bool), 0
+
+    # NaN-skipping min/max reduce straight to one value per column, so no
+    # (N, 5) boolean mask is materialized: the max is NaN only when every
+    # value is NaN, and the min is negative iff any value is.
+    all_nan = np.isnan(np.fmax.reduce(a, axis=0))
+    neg_any = np.fmin.reduce(a, axis=0) < 0
+    n_hl_bad = int(np.count_nonzero(a[:, 1] < a[:, 2]))
+    return all_nan, neg_any, n_hl_bad
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _scan_ohlcv(a):
+        """Compiled `_scan_ohlcv_numpy`: one sweep, no boolean temporaries."""
+        n_rows, n_cols = a.shape
+        all_nan = np.ones(n_cols, dtype=np.bool_)
+        neg_any = np.zeros(n_cols, dtype=np.bool_)
+
+        # Column-outer: pandas hands back column-major blocks
+        for j in range(n_cols):
+            for i in range(n_rows):
+                v = a[i, j]
+                if not np.isnan(v):
+                    all_nan[j] = False
+                    if v < 0.0:
+                        # Both flags for this column are settled
+                        neg_any[j] = True
+                        break
+
+        n_hl_bad = 0
+        for i in range(n_rows):
+            if a[i, 1] < a[i, 2]:
+                n_hl_bad += 1
+
+        return all_nan, neg_any, n_hl_bad
+
+else:
+    _scan_ohlcv = _scan_ohlcv_numpy
+
 
 # ============ DATA VALIDATOR ============
 
@@ -49,18 +122,18 @@ class MarketDataValidator:
     @staticmethod
     def validate(df: pd.DataFrame, symbol: str = "UNKNOWN") -> pd.DataFrame:
         """
-        Validate market data and return cleaned copy.
+        Validate market data.
 
         Performs all validation checks and raises appropriate exceptions
-        if data is invalid. Returns a copy of the validated DataFrame
-        with minor cleaning applied.
+        if data is invalid. Validation is read-only, so the input frame
+        is returned as-is rather than copied.
 
         Args:
             df: Market data DataFrame from yfinance.
             symbol: Stock symbol (for error messages).
 
         Returns:
-            Validated DataFrame (copy of input with minor cleaning).
+            The validated DataFrame (same object as `df`).
 
         Raises:
             DataValidationError: If validation fails.
@@ -76,28 +149,23 @@ class MarketDataValidator:
         # Check if dataframe is empty
         MarketDataValidator._check_empty(df, symbol)
 
+        # Resolve which required columns exist once for all checks
+        cols_present = REQUIRED_COLUMNS.intersection(df.columns)
+
         # Check required columns
-        MarketDataValidator._check_required_columns(df, symbol)
+        MarketDataValidator._check_required_columns(df, symbol, cols_present)
 
         # Check data types
-        MarketDataValidator._check_data_types(df, symbol)
-
-        # Check for all-NaN columns
-        MarketDataValidator._check_all_nan_columns(df, symbol)
+        MarketDataValidator._check_data_types(df, symbol, cols_present)
 
         # Check for sufficient data
         MarketDataValidator._check_sufficient_data(df, symbol)
 
-        # Check valid price ranges
-        MarketDataValidator._check_valid_prices(df, symbol)
-
-        # Check non-negative volume
-        MarketDataValidator._check_valid_volume(df, symbol)
+        # Check all-NaN columns, price ranges and volume in one pass
+        MarketDataValidator._check_all_vectorized(df, symbol)
 
-        # Return cleaned copy
-        df_clean = df.copy()
-        logger.info(f"Data validation passed for {symbol}: {len(df_clean)} bars")
-        return df_clean
+        logger.info(f"Data validation passed for {symbol}: {len(df)} bars")
+        return df
 
     @staticmethod
     def _check_empty(df: pd.DataFrame, symbol: str) -> None:
@@ -114,14 +182,21 @@ class MarketDataValidator:
             )
 
     @staticmethod
-    def _check_required_columns(df: pd.DataFrame, symbol: str) -> None:
+    def _check_required_columns(
+        df: pd.DataFrame, symbol: str, cols_present: FrozenSet[str]
+    ) -> None:
         """
         Check that all required columns are present.
 
+        Args:
+            df: Market data DataFrame.
+            symbol: Stock symbol (for error messages).
+            cols_present: Required columns found in `df`.
+
         Raises:
             DataValidationError: If required columns are missing.
         """
-        missing = REQUIRED_COLUMNS - set(df.columns)
+        missing = {col for col in _REQUIRED_COLUMNS_TUPLE if col not in cols_present}
         
         if missing:
             raise DataValidationError(
@@ -131,52 +206,29 @@ class MarketDataValidator:
             )
 
     @staticmethod
-    def _check_data_types(df: pd.DataFrame, symbol: str) -> None:
+    def _check_data_types(
+        df: pd.DataFrame, symbol: str, cols_present: FrozenSet[str]
+    ) -> None:
         """
         Check that column data types are valid.
 
-        Raises:
-            DataValidationError: If data types are invalid.
-        """
-        price_columns = {"Open", "High", "Low", "Close"}
-        volume_columns = {"Volume"}
-        
-        # Check price columns are numeric
-        for col in price_columns:
-            if col in df.columns:
-                if not pd.api.types.is_numeric_dtype(df[col]):
-                    raise DataValidationError(
-                        f"Column {col} must be numeric",
-                        column=col,
-                        reason="invalid_dtype",
-                    )
-        
-        # Check volume is numeric
-        for col in volume_columns:
-            if col in df.columns:
-                if not pd.api.types.is_numeric_dtype(df[col]):
-                    raise DataValidationError(
-                        f"Column {col} must be numeric",
-                        column=col,
-                        reason="invalid_dtype",
-                    )
-
-    @staticmethod
-    def _check_all_nan_columns(df: pd.DataFrame, symbol: str) -> None:
-        """
-        Check that no required columns are entirely NaN.
+        Args:
+            df: Market data DataFrame.
+            symbol: Stock symbol (for error messages).
+            cols_present: Required columns found in `df`.
 
         Raises:
-            DataValidationError: If any required column is all NaN.
+            DataValidationError: If data types are invalid.
         """
-        for col in REQUIRED_COLUMNS:
-            if col in df.columns:
-                if df[col].isna().all():
-                    raise DataValidationError(
-                        f"Column {col} contains only NaN values",
-                        column=col,
-                        reason="all_nan",
-                    )
+        # dtype.kind is a one-character lookup: float, signed, unsigned int
+        dtypes = df.dtypes
+        for col in _REQUIRED_COLUMNS_TUPLE:
+            if col in cols_present and dtypes[col].kind not in "fiu":
+                raise DataValidationError(
+                    f"Column {col} must be numeric",
+                    column=col,
+                    reason="invalid_dtype",
+                )
 
     @staticmethod
     def _check_sufficient_data(df: pd.DataFrame, symbol: str) -> None:
@@ -195,55 +247,63 @@ class MarketDataValidator:
             )
 
     @staticmethod
-    def _check_valid_prices(df: pd.DataFrame, symbol: str) -> None:
+    def _check_all_vectorized(df: pd.DataFrame, symbol: str) -> None:
         """
-        Check that prices are in valid ranges.
+        Run the all-NaN, price range and volume checks in a single scan.
+
+        Pulls the OHLCV columns out as one 2D float block and computes
+        every reduction from it, instead of scanning each column once
+        per check. Uses a compiled kernel when numba is installed.
 
         Validates:
-        - All prices are positive
+        - No required column is entirely NaN
+        - All prices are non-negative
         - High >= Low for each bar
-        - Close is between High and Low (mostly)
+        - Volume is non-negative
 
         Raises:
-            DataValidationError: If price validation fails.
+            DataValidationError: If any of the checks fail.
         """
+        columns = _REQUIRED_COLUMNS_TUPLE
+        arr = df[list(columns)].to_numpy(dtype=np.float64, na_value=np.nan, copy=False)
+
+        all_nan, neg_any, n_hl_bad = _scan_ohlcv(arr)
+
+        # Check for all-NaN columns
+        if all_nan.any():
+            col = columns[int(np.argmax(all_nan))]
+            raise DataValidationError(
+                f"Column {col} contains only NaN values",
+                column=col,
+                reason="all_nan",
+            )
+
         # Check for negative prices
-        for col in {"Open", "High", "Low", "Close"}:
-            if col in df.columns:
-                if (df[col] < 0).any():
-                    raise DataValidationError(
-                        f"Column {col} contains negative prices",
-                        column=col,
-                        reason="negative_price",
-                    )
+        if neg_any[:4].any():
+            col = columns[int(np.argmax(neg_any[:4]))]
+            raise DataValidationError(
+                f"Column {col} contains negative prices",
+                column=col,
+                reason="negative_price",
+            )
 
         # Check High >= Low
-        if "High" in df.columns and "Low" in df.columns:
-            invalid = df["High"] < df["Low"]
-            if invalid.any():
-                invalid_count = invalid.sum()
-                raise DataValidationError(
-                    f"{invalid_count} bars have High < Low",
-                    column="High/Low",
-                    reason="invalid_range",
-                    value_count=invalid_count,
-                )
-
-    @staticmethod
-    def _check_valid_volume(df: pd.DataFrame, symbol: str) -> None:
-        """
-        Check that volume is non-negative.
+        if n_hl_bad:
+            invalid_count = int(n_hl_bad)
+            raise DataValidationError(
+                f"{invalid_count} bars have High < Low",
+                column="High/Low",
+                reason="invalid_range",
+                value_count=invalid_count,
+            )
 
-        Raises:
-            DataValidationError: If volume is negative.
-        """
-        if "Volume" in df.columns:
-            if (df["Volume"] < 0).any():
-                raise DataValidationError(
-                    "Volume contains negative values",
-                    column="Volume",
-                    reason="negative_volume",
-                )
+        # Check non-negative volume
+        if neg_any[4]:
+            raise DataValidationError(
+                "Volume contains negative values",
+                column="Volume",
+                reason="negative_volume",
+            )
 
     @staticmethod
     def check_for_indicator(df: pd.DataFrame, indicator_name: str) -> bool:
@@ -286,6 +346,7 @@ class MarketDataCleaner:
         - Sorts by timestamp
         - Forward-fills small gaps (max 2 periods)
         - Ensures numeric columns have no inf values
+        - Downcasts Volume to an unsigned integer
 
         Args:
             df: Raw market data.
@@ -298,22 +359,37 @@ class MarketDataCleaner:
             >>> data = yf.Ticker('SPY').history(period='1d', interval='1m')
             >>> cleaned = MarketDataCleaner.clean(data, 'SPY')
         """
-        df_clean = df.copy()
-        initial_rows = len(df_clean)
-
-        # Remove duplicate timestamps
-        df_clean = df_clean[~df_clean.index.duplicated(keep='first')]
-
-        # Sort by timestamp
-        df_clean = df_clean.sort_index()
-
-        # Forward-fill small gaps (max 2 periods)
-        for col in df_clean.columns:
-            if pd.api.types.is_numeric_dtype(df_clean[col]):
-                df_clean[col] = df_clean[col].fillna(method='ffill', limit=2)
-
-        # Replace inf with NaN
-        df_clean = df_clean.replace([np.inf, -np.inf], np.nan)
+        initial_rows = len(df)
+
+        # Shallow copy: the column assignments below replace whole columns,
+        # so the caller's frame is never written to and no data is copied
+        df_clean = df.copy(deep=False)
+
+        # Remove duplicate timestamps (skipped for the usual unique index)
+        if not df_clean.index.is_unique:
+            df_clean = df_clean[~df_clean.index.duplicated(keep='first')]
+
+        # Sort by timestamp (skipped when already in order)
+        if not df_clean.index.is_monotonic_increasing:
+            df_clean = df_clean.sort_index()
+
+        # Forward-fill small gaps (max 2 periods) across all numeric
+        # columns in one block-level call
+        num_cols = df_clean.select_dtypes(include=np.number).columns
+        df_clean[num_cols] = df_clean[num_cols].ffill(limit=2)
+
+        # Replace inf with NaN (only float columns can hold inf, and the
+        # frame is rewritten only when one is actually present)
+        float_cols = df_clean.select_dtypes(include="floating").columns
+        inf_mask = np.isinf(
+            df_clean[float_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        if inf_mask.any():
+            df_clean[float_cols] = df_clean[float_cols].mask(inf_mask)
+
+        # Shrink Volume to the narrowest lossless dtype (after the inf
+        # replacement, so no inf reaches the integer cast)
+        df_clean = MarketDataCleaner._downcast(df_clean)
 
         rows_removed = initial_rows - len(df_clean)
         if rows_removed > 0:
@@ -321,6 +397,32 @@ class MarketDataCleaner:
 
         return df_clean
 
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast Volume to the smallest unsigned integer type that holds it.
+
+        Prices stay float64: float32 rounding would break the
+        High >= Close >= Low invariant and show up in reported prices.
+        A missing or non-numeric Volume is left for the validator to
+        report, and Volume with negative values keeps its signed dtype
+        so the negative-volume check still fires instead of the values
+        wrapping around. Volume with gaps or fractions stays float.
+
+        Args:
+            df: Frame owned by the cleaner (modified in place).
+
+        Returns:
+            The same frame with downcast columns.
+        """
+        dtypes = df.dtypes
+
+        if "Volume" in dtypes.index and dtypes["Volume"].kind in "fiu":
+            if not (df["Volume"] < 0).any():
+                df["Volume"] = pd.to_numeric(df["Volume"], downcast="unsigned")
+
+        return df
+
 
 # ============ DATA VALIDATION PIPELINE ============
 
@@ -329,9 +431,26 @@ class DataValidationPipeline:
     """
     Complete pipeline for validating market data.
 
-    Combines validation and cleaning into a single operation.
+    Combines validation and cleaning into a single operation. Windows
+    already validated in this process (same symbol, bar count and last
+    timestamp) skip re-validation; cleaning always runs.
     """
 
+    _recent_validations: "OrderedDict[Tuple[Any, ...], None]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    """Guards `_recent_validations` (analyses run on a thread pool)."""
+
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame, symbol: str) -> Tuple[Any, ...]:
+        """Identify a validated window by symbol, bar count and last timestamp."""
+        return (symbol, len(df), df.index[-1] if len(df) else None)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all remembered validations."""
+        with DataValidationPipeline._cache_lock:
+            DataValidationPipeline._recent_validations.clear()
+
     @staticmethod
     def process(df: pd.DataFrame, symbol: str = "UNKNOWN") -> pd.DataFrame:
         """
@@ -358,8 +477,34 @@ class DataValidationPipeline:
         # Step 1: Clean
         df_clean = MarketDataCleaner.clean(df, symbol)
 
-        # Step 2: Validate
-        df_validated = MarketDataValidator.validate(df_clean, symbol)
+        # Step 2: Validate (unless this exact window already passed).
+        # Unnamed data is never cached: frames from different tickers share
+        # bar counts and timestamps.
+        recent = DataValidationPipeline._recent_validations
+        lock = DataValidationPipeline._cache_lock
+        fingerprint = DataValidationPipeline._fingerprint(df_clean, symbol)
+        cacheable = symbol != "UNKNOWN"
+
+        hit = False
+        if cacheable:
+            with lock:
+                hit = fingerprint in recent
+                if hit:
+                    recent.move_to_end(fingerprint)
+
+        if hit:
+            df_validated = df_clean
+            logger.debug(f"Validation cache hit for {symbol}")
+        else:
+            # Validate outside the lock; only the bookkeeping is serialized
+            df_validated = MarketDataValidator.validate(df_clean, symbol)
+
+            if cacheable:
+                with lock:
+                    recent[fingerprint] = None
+                    recent.move_to_end(fingerprint)
+                    if len(recent) > VALIDATION_CACHE_SIZE:
+                        recent.popitem(last=False)
 
         logger.info(f"Data pipeline complete for {symbol}: {len(df_validated)} bars")
 
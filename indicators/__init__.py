@@ -10,6 +10,8 @@ Exports:
     MomentumIndicator: Base class for momentum indicators.
     VolatilityIndicator: Base class for volatility indicators.
     VolumeIndicator: Base class for volume indicators.
+    OHLCVArrays: Price columns as arrays, shared across indicators.
+    OutputBuffer: Preallocated storage for indicator output columns.
 
     IndicatorRegistry: Registry for dynamic indicator creation.
     IndicatorFactory: Factory with pre-built indicator suites.
@@ -33,6 +35,8 @@ from indicators.base import (
     VolumeIndicator,
     CompositeIndicator,
     IndicatorGroup,
+    OHLCVArrays,
+    OutputBuffer,
 )
 from indicators.registry import IndicatorRegistry, IndicatorFactory
 from indicators.moving_averages import (
@@ -59,6 +63,8 @@ __all__ = [
     "VolumeIndicator",
     "CompositeIndicator",
     "IndicatorGroup",
+    "OHLCVArrays",
+    "OutputBuffer",
     # Registry
     "IndicatorRegistry",
     "IndicatorFactory",
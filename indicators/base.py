@@ -5,9 +5,11 @@ Provides abstract base classes and interfaces for implementing
 technical indicators with a consistent API.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 import pandas as pd
 import numpy as np
 from logging_config import get_logger
@@ -64,6 +66,197 @@ class IndicatorMetadata:
         return f"{self.name} ({self.key})"
 
 
+# ============ SHARED PRICE ARRAYS ============
+
+# Columns unpacked into OHLCVArrays
+_ARRAY_COLUMNS = ("High", "Low", "Close", "Volume")
+
+
+@dataclass(frozen=True)
+class OHLCVArrays:
+    """
+    Structure-of-arrays view of the price columns.
+
+    Built once per frame by the driver (`IndicatorGroup`,
+    `CompositeIndicator`) and handed to every indicator that sets
+    `accepts_arrays`, so each one reads plain contiguous float64
+    arrays instead of re-extracting and converting the same columns.
+    Indicators only ever add columns, so the arrays stay valid for
+    the whole run. The previous close is derived once here as well,
+    rather than shifted separately by every indicator that needs it.
+
+    Example:
+        >>> arrays = OHLCVArrays.from_frame(market_data)
+        >>> result = AverageTrueRange(14).execute(market_data, arrays=arrays)
+    """
+
+    high: np.ndarray
+    """High prices (float64)."""
+
+    low: np.ndarray
+    """Low prices (float64)."""
+
+    close: np.ndarray
+    """Closing prices (float64)."""
+
+    volume: np.ndarray
+    """Volumes (float64)."""
+
+    prev_close: np.ndarray
+    """Previous bar's close (float64, NaN on the first bar)."""
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> OHLCVArrays:
+        """
+        Extract the price columns of a frame.
+
+        Args:
+            df: Market data with High, Low, Close, Volume columns.
+
+        Returns:
+            OHLCVArrays with one float64 array per column (missing
+            values as NaN) plus the previous close.
+        """
+        high, low, close, volume = (
+            np.ascontiguousarray(df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            for col in _ARRAY_COLUMNS
+        )
+
+        prev_close = np.empty_like(close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close[:-1]
+
+        return cls(
+            high=high, low=low, close=close, volume=volume, prev_close=prev_close
+        )
+
+    @staticmethod
+    def supported(df: pd.DataFrame) -> bool:
+        """Whether `df` has every column needed by `from_frame()`."""
+        return all(col in df.columns for col in _ARRAY_COLUMNS)
+
+    def __len__(self) -> int:
+        """Return number of bars."""
+        return len(self.close)
+
+
+# ============ OUTPUT BUFFER ============
+
+
+class OutputBuffer:
+    """
+    Preallocated 2-D storage for indicator output columns.
+
+    `IndicatorGroup` allocates one buffer for the outputs of all its
+    array-based indicators, which write into it by column name instead
+    of inserting one DataFrame column at a time. The written columns are
+    joined onto the frame once at the end as a single block.
+
+    Example:
+        >>> buffer = OutputBuffer(len(df), ["ATR_14", "TR_14"])
+        >>> result = AverageTrueRange(14).execute(df, arrays=arrays, out=buffer)
+        >>> result = buffer.join(result)
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        columns: Sequence[str],
+        dtype: np.dtype = np.dtype(np.float32),
+    ):
+        """
+        Allocate the buffer.
+
+        Args:
+            n_rows: Number of bars.
+            columns: Output column names (duplicates are stored once).
+            dtype: Storage dtype (default: float32).
+        """
+        self.col_index: Dict[str, int] = {}
+        for column in columns:
+            self.col_index.setdefault(column, len(self.col_index))
+
+        # Column-major, so each output column is contiguous
+        self.values = np.empty((n_rows, len(self.col_index)), dtype=dtype, order="F")
+        self.written: Set[str] = set()
+
+    @classmethod
+    def for_indicators(
+        cls,
+        indicators: Iterable[IndicatorBase],
+        n_rows: int,
+        dtype: np.dtype = np.dtype(np.float32),
+    ) -> OutputBuffer:
+        """
+        Allocate a buffer for the indicators that accept one.
+
+        Only indicators whose `dtype` matches the buffer's get a slot;
+        the others keep storing their columns in the frame, so one
+        float64 indicator never widens everyone else's output.
+
+        Args:
+            indicators: Indicators about to run.
+            n_rows: Number of bars.
+            dtype: Storage dtype of the buffer (default: float32).
+
+        Returns:
+            OutputBuffer covering their output columns.
+        """
+        columns = [
+            col
+            for ind in indicators
+            if ind.accepts_arrays and np.dtype(ind.dtype) == dtype
+            for col in ind.metadata.output_columns
+        ]
+        return cls(n_rows, columns, dtype)
+
+    def __contains__(self, column: str) -> bool:
+        """Whether the buffer has a slot for `column`."""
+        return column in self.col_index
+
+    def __setitem__(self, column: str, values: np.ndarray) -> None:
+        """
+        Write one output column.
+
+        Args:
+            column: Column name (must have a slot).
+            values: Values to store (cast to the buffer dtype).
+        """
+        self.values[:, self.col_index[column]] = values
+        self.written.add(column)
+
+    def discard(self, columns: Iterable[str]) -> None:
+        """Forget columns whose indicator failed part-way."""
+        self.written.difference_update(columns)
+
+    def join(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Append the written columns to a frame.
+
+        Args:
+            df: Frame the buffer rows belong to.
+
+        Returns:
+            `df` with the written columns appended (replacing any
+            existing columns of the same name).
+        """
+        if not self.written:
+            return df
+
+        columns = [col for col in self.col_index if col in self.written]
+        if len(columns) == len(self.col_index):
+            block = self.values
+        else:
+            block = self.values[:, [self.col_index[col] for col in columns]]
+
+        outputs = pd.DataFrame(block, index=df.index, columns=columns, copy=False)
+        stale = [col for col in columns if col in df.columns]
+        if stale:
+            df = df.drop(columns=stale)
+
+        return pd.concat([df, outputs], axis=1)
+
+
 # ============ INDICATOR BASE CLASS ============
 
 
@@ -98,6 +291,12 @@ class IndicatorBase(ABC):
         ...         return df
     """
 
+    accepts_arrays: bool = False
+    """Whether `calculate()` takes `arrays` (OHLCVArrays) and `out` (OutputBuffer)."""
+
+    dtype: np.dtype = np.dtype(np.float32)
+    """Storage dtype of output columns (calculations run in float64)."""
+
     @property
     @abstractmethod
     def metadata(self) -> IndicatorMetadata:
@@ -161,7 +360,8 @@ class IndicatorBase(ABC):
         Calculate indicator values and add to DataFrame.
 
         Must be implemented by subclasses. Should:
-        1. Create a copy of the DataFrame
+        1. Create a copy of the DataFrame (a shallow `copy(deep=False)`
+           is enough when only new columns are added)
         2. Calculate indicator values
         3. Add to DataFrame as new columns
         4. Return modified DataFrame
@@ -178,7 +378,33 @@ class IndicatorBase(ABC):
         """
         pass
 
-    def execute(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _store(
+        self,
+        result: pd.DataFrame,
+        out: Optional[OutputBuffer],
+        column: str,
+        values: np.ndarray,
+    ) -> None:
+        """
+        Store an output column in `out` if it has a slot, else in `result`.
+
+        Args:
+            result: Frame being built by `calculate()`.
+            out: Shared output buffer, if any.
+            column: Output column name.
+            values: Column values.
+        """
+        if out is not None and column in out and out.values.dtype == self.dtype:
+            out[column] = values
+        else:
+            result[column] = values.astype(self.dtype, copy=False)
+
+    def execute(
+        self,
+        df: pd.DataFrame,
+        arrays: Optional[OHLCVArrays] = None,
+        out: Optional[OutputBuffer] = None,
+    ) -> pd.DataFrame:
         """
         Execute indicator calculation with validation.
 
@@ -187,6 +413,10 @@ class IndicatorBase(ABC):
 
         Args:
             df: Market data DataFrame.
+            arrays: Pre-extracted price arrays of `df`, passed on to
+                indicators that set `accepts_arrays` (ignored otherwise).
+            out: Output buffer for indicators that set `accepts_arrays`;
+                their columns are then written there instead of `df`.
 
         Returns:
             DataFrame with indicator added.
@@ -207,11 +437,16 @@ class IndicatorBase(ABC):
 
             # Calculate
             logger.debug(f"Calculating {meta.name} on {len(df)} bars")
-            result = self.calculate(df)
+            if self.accepts_arrays:
+                result = self.calculate(df, arrays=arrays, out=out)
+            else:
+                result = self.calculate(df)
 
             # Verify output
             for col in meta.output_columns:
-                if col not in result.columns:
+                if col not in result.columns and not (
+                    out is not None and col in out.written
+                ):
                     raise SignalDetectionError(
                         f"{meta.name} failed to create column: {col}",
                         indicator=meta.key,
@@ -389,10 +624,11 @@ class CompositeIndicator(IndicatorBase):
             DataFrame with all indicators calculated.
         """
         result = df.copy()
+        arrays = OHLCVArrays.from_frame(result) if OHLCVArrays.supported(result) else None
 
         for indicator in self.indicators:
             logger.debug(f"Calculating sub-indicator: {indicator.metadata.name}")
-            result = indicator.execute(result)
+            result = indicator.execute(result, arrays=arrays)
 
         return result
 
@@ -444,14 +680,20 @@ class IndicatorGroup:
 
         logger.info(f"Executing indicator group: {self.name} ({len(self.indicators)} indicators)")
 
+        # Price columns are unpacked once and shared by every indicator;
+        # array-based indicators write into one preallocated buffer
+        arrays = OHLCVArrays.from_frame(result) if OHLCVArrays.supported(result) else None
+        buffer = OutputBuffer.for_indicators(self.indicators, len(result))
+
         for indicator in self.indicators:
             try:
-                result = indicator.execute(result)
+                result = indicator.execute(result, arrays=arrays, out=buffer)
             except (InsufficientDataError, SignalDetectionError) as e:
+                buffer.discard(indicator.metadata.output_columns)
                 logger.warning(f"Skipping {indicator.metadata.name}: {str(e)}")
                 continue
 
-        return result
+        return buffer.join(result)
 
     def get_output_columns(self) -> List[str]:
         """
@@ -4,12 +4,16 @@ Trend and Volume indicators (ADX, ATR, OBV, Volume MA).
 Technical indicators for trend strength and volume analysis.
 """
 
-from typing import Set
+from functools import cached_property
+from typing import Callable, Dict, Optional, Set, Tuple
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from indicators.base import (
     IndicatorBase,
     IndicatorMetadata,
+    OHLCVArrays,
+    OutputBuffer,
     TrendIndicator,
     VolumeIndicator,
 )
@@ -17,6 +21,433 @@ from logging_config import get_logger
 
 logger = get_logger()
 
+try:
+    import bottleneck as bn
+
+    _BOTTLENECK_AVAILABLE = True
+except ImportError:
+    _BOTTLENECK_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ============ HELPERS ============
+
+
+def _true_range(
+    high: np.ndarray, low: np.ndarray, prev_close: np.ndarray
+) -> np.ndarray:
+    """
+    True Range as a single ndarray.
+
+    TR = Max(High - Low, |High - Close_prev|, |Low - Close_prev|), built
+    from two fused element-wise maxima instead of a 3-column frame.
+    Missing terms are skipped (fmax), so the first bar, which has no
+    previous close, gets High - Low.
+
+    Args:
+        high: float64 high prices.
+        low: float64 low prices.
+        prev_close: float64 previous closes (NaN on the first bar).
+
+    Returns:
+        float64 True Range per bar, same shape as the inputs.
+    """
+    return np.fmax(
+        np.fmax(high - low, np.abs(high - prev_close)),
+        np.abs(low - prev_close),
+    )
+
+
+def _average_true_range_numpy(
+    high: np.ndarray, low: np.ndarray, prev_close: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    True Range and its simple moving average (vectorized).
+
+    Works along the last axis, so (n_symbols, n_bars) inputs are
+    handled in one call as well.
+
+    Args:
+        high: float64 high prices.
+        low: float64 low prices.
+        prev_close: float64 previous closes (NaN on the first bar).
+        period: ATR window.
+
+    Returns:
+        (TR, ATR) as float64 arrays; ATR is NaN until a full window of
+        valid TR values is available.
+    """
+    tr = _true_range(high, low, prev_close)
+
+    # Window sums over a strided view (no Rolling object); any NaN in a
+    # window propagates, like rolling() with min_periods=period
+    atr = np.full(tr.shape, np.nan)
+    if tr.shape[-1] >= period:
+        windows = sliding_window_view(tr, period, axis=-1)
+        atr[..., period - 1:] = windows.sum(axis=-1) / period
+
+    return tr, atr
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _nan_max(a, b):
+        """max() that skips a NaN operand, like np.fmax."""
+        if a != a:
+            return b
+        if b != b:
+            return a
+        return a if a >= b else b
+
+    @njit(cache=True)
+    def _atr_kernel(high, low, prev_close, period, tr_out, atr_out):
+        """
+        Compiled TR + rolling mean in one pass.
+
+        The window sum is updated incrementally (add the new bar, drop
+        the one leaving the window) with the same compensated summation
+        and constant-window shortcut as pandas' rolling mean, so the
+        output matches `rolling(period).mean()`.
+        """
+        total = 0.0
+        comp_add = 0.0
+        comp_remove = 0.0
+        nobs = 0  # valid TR values in the window
+        n_same = 0  # length of the current run of identical TR values
+        last = np.nan
+
+        for i in range(high.shape[0]):
+            pc = prev_close[i]
+            tr = _nan_max(
+                _nan_max(high[i] - low[i], abs(high[i] - pc)), abs(low[i] - pc)
+            )
+            tr_out[i] = tr
+
+            if i >= period:
+                old = tr_out[i - period]
+                if old == old:
+                    nobs -= 1
+                    y = -old - comp_remove
+                    t = total + y
+                    comp_remove = t - total - y
+                    total = t
+
+            if tr == tr:
+                nobs += 1
+                y = tr - comp_add
+                t = total + y
+                comp_add = t - total - y
+                total = t
+                n_same = n_same + 1 if tr == last else 1
+                last = tr
+
+            if nobs >= period:
+                if n_same >= nobs:
+                    atr_out[i] = last
+                else:
+                    # TR is never negative; clamp summation drift
+                    mean = total / nobs
+                    atr_out[i] = mean if mean > 0.0 else 0.0
+            else:
+                atr_out[i] = np.nan
+
+    @njit(cache=True, parallel=True)
+    def _atr_rows(highs, lows, prev_closes, period, tr_out, atr_out):
+        """Run the ATR kernel on every row (symbol) in parallel."""
+        for s in prange(highs.shape[0]):
+            _atr_kernel(
+                highs[s], lows[s], prev_closes[s], period, tr_out[s], atr_out[s]
+            )
+
+    def _average_true_range(
+        high: np.ndarray, low: np.ndarray, prev_close: np.ndarray, period: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """True Range and ATR via the compiled kernel (1-D or 2-D inputs)."""
+        tr = np.empty(high.shape, dtype=np.float64)
+        atr = np.empty(high.shape, dtype=np.float64)
+        if high.ndim == 2:
+            _atr_rows(high, low, prev_close, period, tr, atr)
+        else:
+            _atr_kernel(high, low, prev_close, period, tr, atr)
+        return tr, atr
+
+else:
+    _average_true_range = _average_true_range_numpy
+
+
+def _on_balance_volume_numpy(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    On-Balance Volume from close and volume arrays (vectorized).
+
+    Args:
+        close: float64 closing prices.
+        volume: float64 volumes.
+
+    Returns:
+        float64 OBV per bar, starting at 0.
+    """
+    # Determine if close is up (+1), down (-1), or same (0); NaN
+    # comparisons are False, so a missing close carries OBV forward
+    change = np.diff(close, prepend=close[:1])
+    direction = (change > 0).astype(np.float64) - (change < 0)
+
+    # Signed volume, accumulated; unchanged bars add exactly nothing
+    signed = np.where(direction != 0, direction * volume, 0.0)
+    signed[:1] = 0.0
+
+    return np.cumsum(signed)
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _obv_kernel(close, volume, out):
+        """Compiled OBV loop: one pass, no temporaries."""
+        n = close.shape[0]
+        if n == 0:
+            return
+        out[0] = 0.0
+        for i in range(1, n):
+            change = close[i] - close[i - 1]
+            if change > 0:
+                out[i] = out[i - 1] + volume[i]
+            elif change < 0:
+                out[i] = out[i - 1] - volume[i]
+            else:
+                out[i] = out[i - 1]
+
+    def _on_balance_volume(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """On-Balance Volume via the compiled kernel."""
+        out = np.empty(len(close), dtype=np.float64)
+        _obv_kernel(close, volume, out)
+        return out
+
+else:
+    _on_balance_volume = _on_balance_volume_numpy
+
+
+def _make_rolling_mean(period: int) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Compile a rolling mean with the window size baked in.
+
+    `period` is a closure constant, so numba compiles (and caches on
+    disk) one specialization per window size. The window sum is updated
+    incrementally in the same order as bottleneck's move_mean, so both
+    give identical results.
+
+    Args:
+        period: Window size.
+
+    Returns:
+        Function mapping a float64 array to its rolling mean, averaging
+        the valid values in each window (NaN when there are none).
+    """
+
+    @njit(cache=True)
+    def rolling_mean(values):
+        out = np.empty(values.shape[0], dtype=np.float64)
+        total = 0.0
+        count = 0
+        for i in range(values.shape[0]):
+            new = values[i]
+            if new == new:
+                total += new
+                count += 1
+            # Divide while the window fills, multiply by the reciprocal
+            # once it is full (bottleneck's rounding)
+            if i < period:
+                out[i] = total / count if count > 0 else np.nan
+                continue
+            old = values[i - period]
+            if old == old:
+                total -= old
+                count -= 1
+            out[i] = total * (1.0 / count) if count > 0 else np.nan
+        return out
+
+    return rolling_mean
+
+
+def _nan_diff(values: np.ndarray) -> np.ndarray:
+    """
+    First difference with NaN on the first bar (like `Series.diff()`).
+
+    Args:
+        values: Price array.
+
+    Returns:
+        Differences in the input's float dtype (float64 for integers).
+    """
+    out = np.empty(len(values), dtype=np.result_type(values.dtype, np.float32))
+    out[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=out[1:])
+    return out
+
+
+def _wilder_smooth(values: np.ndarray, seed: float, period: int) -> np.ndarray:
+    """
+    Wilder smoothing as an exponential mean seeded with `seed`.
+
+    Each value v moves the mean as y = y * (1 - 1/period) + v / period,
+    i.e. `ewm(alpha=1/period, adjust=False)` over [seed, *values].
+
+    Args:
+        values: float64 values following the seed.
+        seed: Starting value of the recursion.
+        period: Smoothing period.
+
+    Returns:
+        float64 array of length len(values) + 1 (seed first).
+    """
+    return (
+        pd.Series(np.concatenate(([seed], values)))
+        .ewm(alpha=1.0 / period, adjust=False)
+        .mean()
+        .to_numpy()
+    )
+
+
+def _wilder_adx_numpy(tr, plus_dm, minus_dm, period, out_adx, out_pdi, out_mdi):
+    """
+    Wilder-smoothed +DI, -DI and ADX (vectorized).
+
+    Same results and gap handling as the compiled kernel: bars with a
+    missing input are dropped before smoothing and left NaN. The running
+    sums are Wilder-smoothed TR/DM scaled by `period`, so they are
+    computed as seeded exponential means of `period * value`.
+
+    Args:
+        tr: float64 True Range per bar.
+        plus_dm: float64 +DM per bar (NaN on the first bar).
+        minus_dm: float64 -DM per bar (NaN on the first bar).
+        period: Smoothing period.
+        out_adx: Output ADX array (filled in place).
+        out_pdi: Output +DI array (filled in place).
+        out_mdi: Output -DI array (filled in place).
+    """
+    out_adx[:] = np.nan
+    out_pdi[:] = np.nan
+    out_mdi[:] = np.nan
+
+    valid = ~(np.isnan(tr) | np.isnan(plus_dm) | np.isnan(minus_dm))
+    valid[:1] = False
+    rows = np.flatnonzero(valid)
+    if len(rows) < period:
+        return
+
+    tr_s, pdm_s, mdm_s = (
+        _wilder_smooth(values[period:] * period, values[:period].sum(), period)
+        for values in (tr[rows], plus_dm[rows], minus_dm[rows])
+    )
+
+    # Flat stretches give 0 instead of dividing by zero
+    pdi = np.zeros_like(tr_s)
+    mdi = np.zeros_like(tr_s)
+    np.divide(100.0 * pdm_s, tr_s, out=pdi, where=tr_s > 0.0)
+    np.divide(100.0 * mdm_s, tr_s, out=mdi, where=tr_s > 0.0)
+
+    di_sum = pdi + mdi
+    dx = np.zeros_like(di_sum)
+    np.divide(100.0 * np.abs(pdi - mdi), di_sum, out=dx, where=di_sum > 0.0)
+
+    ready = rows[period - 1:]
+    out_pdi[ready] = pdi
+    out_mdi[ready] = mdi
+
+    if len(dx) >= period:
+        adx = _wilder_smooth(dx[period:], dx[:period].sum() / period, period)
+        out_adx[ready[period - 1:]] = adx
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _wilder_adx(tr, plus_dm, minus_dm, period, out_adx, out_pdi, out_mdi):
+        """
+        Wilder-smoothed +DI, -DI and ADX in a single pass.
+
+        Bars with a missing TR or DM leave the smoothing state untouched and
+        get NaN outputs, so a gap does not poison the rest of the series.
+        Flat stretches (zero range or no directional movement) give 0
+        rather than dividing by zero.
+
+        Args:
+            tr: float64 True Range per bar.
+            plus_dm: float64 +DM per bar (NaN on the first bar).
+            minus_dm: float64 -DM per bar (NaN on the first bar).
+            period: Smoothing period.
+            out_adx: Output ADX array (filled in place).
+            out_pdi: Output +DI array (filled in place).
+            out_mdi: Output -DI array (filled in place).
+        """
+        out_adx[:] = np.nan
+        out_pdi[:] = np.nan
+        out_mdi[:] = np.nan
+
+        tr_s = 0.0
+        pdm_s = 0.0
+        mdm_s = 0.0
+        n_seed = 0  # bars summed into the TR/DM seed
+        adx = 0.0
+        n_dx = 0  # DX values averaged into the ADX seed
+
+        for i in range(1, tr.shape[0]):
+            t = tr[i]
+            p = plus_dm[i]
+            m = minus_dm[i]
+            if np.isnan(t) or np.isnan(p) or np.isnan(m):
+                continue
+
+            if n_seed < period:
+                tr_s += t
+                pdm_s += p
+                mdm_s += m
+                n_seed += 1
+                if n_seed < period:
+                    continue
+            else:
+                tr_s = tr_s - tr_s / period + t
+                pdm_s = pdm_s - pdm_s / period + p
+                mdm_s = mdm_s - mdm_s / period + m
+
+            if tr_s > 0.0:
+                pdi = 100.0 * pdm_s / tr_s
+                mdi = 100.0 * mdm_s / tr_s
+            else:
+                pdi = 0.0
+                mdi = 0.0
+            out_pdi[i] = pdi
+            out_mdi[i] = mdi
+
+            di_sum = pdi + mdi
+            dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0.0 else 0.0
+
+            if n_dx < period:
+                adx += dx
+                n_dx += 1
+                if n_dx == period:
+                    adx /= period
+                    out_adx[i] = adx
+            else:
+                adx = (adx * (period - 1) + dx) / period
+                out_adx[i] = adx
+
+else:
+    _wilder_adx = _wilder_adx_numpy
+
 
 # ============ AVERAGE TRUE RANGE (ATR) ============
 
@@ -44,6 +475,8 @@ class AverageTrueRange(TrendIndicator):
     - Adapts to market conditions
     """
 
+    accepts_arrays = True
+
     def __init__(self, period: int = 14):
         """
         Initialize ATR indicator.
@@ -59,9 +492,9 @@ class AverageTrueRange(TrendIndicator):
 
         self.period = period
 
-    @property
+    @cached_property
     def metadata(self) -> IndicatorMetadata:
-        """Get ATR metadata."""
+        """Get ATR metadata (built once per instance)."""
         return IndicatorMetadata(
             name=f"Average True Range ({self.period})",
             key=f"atr_{self.period}",
@@ -72,32 +505,88 @@ class AverageTrueRange(TrendIndicator):
             parameters=(("period", int, self.period),),
         )
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate(
+        self,
+        df: pd.DataFrame,
+        arrays: Optional[OHLCVArrays] = None,
+        out: Optional[OutputBuffer] = None,
+    ) -> pd.DataFrame:
         """
         Calculate ATR.
 
         Args:
             df: Market data with High, Low, Close columns.
+            arrays: Price arrays of `df` (extracted here when omitted).
+            out: Shared output buffer to write the columns into.
 
         Returns:
             DataFrame with ATR and TR columns.
         """
-        result = df.copy()
+        result = df.copy(deep=False)
+        if arrays is None:
+            arrays = OHLCVArrays.from_frame(df)
 
-        # Calculate True Range
-        high_low = result["High"] - result["Low"]
-        high_close = np.abs(result["High"] - result["Close"].shift())
-        low_close = np.abs(result["Low"] - result["Close"].shift())
+        # True Range and ATR (SMA of TR) in one pass
+        true_range, atr = _average_true_range(
+            arrays.high, arrays.low, arrays.prev_close, self.period
+        )
 
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = np.max(ranges, axis=1)
+        self._store(result, out, f"TR_{self.period}", true_range)
+        self._store(result, out, f"ATR_{self.period}", atr)
 
-        result[f"TR_{self.period}"] = true_range
+        return result
 
-        # Calculate ATR (SMA of TR)
-        result[f"ATR_{self.period}"] = true_range.rolling(self.period).mean()
+    @classmethod
+    def calculate_batch(
+        cls,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        period: int = 14,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate TR and ATR for many symbols at once.
 
-        return result
+        Each row is one symbol's series (pad shorter histories with NaN
+        at the start). With numba installed the rows are processed in
+        parallel by the compiled ATR kernel; otherwise all rows go
+        through one vectorized pass.
+
+        Args:
+            highs: High prices, shape (n_symbols, n_bars).
+            lows: Low prices, shape (n_symbols, n_bars).
+            closes: Closing prices, shape (n_symbols, n_bars).
+            period: Number of periods for ATR calculation (default: 14).
+
+        Returns:
+            (TR, ATR) arrays of shape (n_symbols, n_bars), each row equal
+            to the TR/ATR columns `calculate()` gives for that symbol.
+
+        Raises:
+            ValueError: If period is not positive or shapes don't match.
+
+        Example:
+            >>> tr, atr = AverageTrueRange.calculate_batch(highs, lows, closes, 14)
+            >>> atr[:, -1]  # latest ATR per symbol
+        """
+        if not isinstance(period, int) or period <= 0:
+            raise ValueError(f"Period must be positive integer, got {period}")
+
+        highs, lows, closes = (
+            np.ascontiguousarray(a, dtype=np.float64) for a in (highs, lows, closes)
+        )
+        if highs.ndim != 2 or not (highs.shape == lows.shape == closes.shape):
+            raise ValueError(
+                "highs, lows and closes must be 2-D arrays of the same shape, got "
+                f"{highs.shape}, {lows.shape}, {closes.shape}"
+            )
+
+        prev_closes = np.empty_like(closes)
+        prev_closes[:, :1] = np.nan
+        prev_closes[:, 1:] = closes[:, :-1]
+
+        tr, atr = _average_true_range(highs, lows, prev_closes, period)
+        return tr.astype(cls.dtype), atr.astype(cls.dtype)
 
 
 # ============ AVERAGE DIRECTIONAL INDEX (ADX) ============
@@ -113,7 +602,13 @@ class AverageDirectionalIndex(TrendIndicator):
     Components:
     - +DI (Plus Directional Indicator)
     - -DI (Minus Directional Indicator)
-    - ADX (Average of DI difference)
+    - ADX (Wilder-smoothed average of DX, the normalized DI difference)
+
+    Smoothing:
+        TR, +DM and -DM are seeded with a sum over the first N bars and
+        then smoothed recursively (S = S - S/N + x, Wilder's method);
+        ADX is seeded with the mean of the first N DX values and then
+        ADX = (ADX_prev * (N - 1) + DX) / N.
 
     Interpretation:
     - ADX < 20 = No trend (directionless market)
@@ -130,6 +625,8 @@ class AverageDirectionalIndex(TrendIndicator):
     - Works well with trending systems
     """
 
+    accepts_arrays = True
+
     def __init__(self, period: int = 14):
         """
         Initialize ADX indicator.
@@ -145,9 +642,9 @@ class AverageDirectionalIndex(TrendIndicator):
 
         self.period = period
 
-    @property
+    @cached_property
     def metadata(self) -> IndicatorMetadata:
-        """Get ADX metadata."""
+        """Get ADX metadata (built once per instance)."""
         return IndicatorMetadata(
             name=f"Average Directional Index ({self.period})",
             key=f"adx_{self.period}",
@@ -158,51 +655,63 @@ class AverageDirectionalIndex(TrendIndicator):
             parameters=(("period", int, self.period),),
         )
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate(
+        self,
+        df: pd.DataFrame,
+        arrays: Optional[OHLCVArrays] = None,
+        out: Optional[OutputBuffer] = None,
+    ) -> pd.DataFrame:
         """
         Calculate ADX with +DI and -DI.
 
         Args:
             df: Market data with High, Low, Close columns.
+            arrays: Price arrays of `df` (extracted here when omitted).
+            out: Shared output buffer to write the columns into.
 
         Returns:
             DataFrame with ADX, Plus_DI, and Minus_DI columns.
         """
-        result = df.copy()
+        result = df.copy(deep=False)
+        if arrays is None:
+            arrays = OHLCVArrays.from_frame(df)
 
         # Calculate True Range
-        high_low = result["High"] - result["Low"]
-        high_close = np.abs(result["High"] - result["Close"].shift())
-        low_close = np.abs(result["Low"] - result["Close"].shift())
-
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        tr = np.max(ranges, axis=1)
+        tr = _true_range(arrays.high, arrays.low, arrays.prev_close)
 
         # Calculate Directional Movements
-        plus_dm = result["High"].diff()
-        minus_dm = -result["Low"].diff()
-
-        # Apply directional rules
-        plus_dm[plus_dm < 0] = 0
-        minus_dm[minus_dm < 0] = 0
-
-        # Prevent both being positive
-        both_positive = (plus_dm > 0) & (minus_dm > 0)
-        plus_dm[both_positive & (plus_dm < minus_dm)] = 0
-        minus_dm[both_positive & (minus_dm < plus_dm)] = 0
-
-        # Calculate DI
-        tr_sum = tr.rolling(self.period).sum()
-        plus_di = 100 * (plus_dm.rolling(self.period).sum() / tr_sum)
-        minus_di = 100 * (minus_dm.rolling(self.period).sum() / tr_sum)
-
-        # Calculate DX and ADX
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(self.period).mean()
+        up_move = _nan_diff(arrays.high)
+        down_move = -_nan_diff(arrays.low)
+
+        # Apply directional rules (NaN on the first bar is kept)
+        up_move = np.where(up_move < 0, 0.0, up_move)
+        down_move = np.where(down_move < 0, 0.0, down_move)
+
+        # Prevent both being positive: the smaller move is zeroed
+        both_positive = (up_move > 0) & (down_move > 0)
+        plus_dm = np.where(both_positive & (up_move < down_move), 0.0, up_move)
+        minus_dm = np.where(both_positive & (down_move < up_move), 0.0, down_move)
+
+        # Wilder-smooth into DI and ADX in one pass (the kernel works in
+        # float64 and only stores into the output dtype)
+        n = len(result)
+        adx = np.empty(n, dtype=self.dtype)
+        plus_di = np.empty(n, dtype=self.dtype)
+        minus_di = np.empty(n, dtype=self.dtype)
+
+        _wilder_adx(
+            tr,
+            plus_dm,
+            minus_dm,
+            self.period,
+            adx,
+            plus_di,
+            minus_di,
+        )
 
-        result[f"Plus_DI_{self.period}"] = plus_di
-        result[f"Minus_DI_{self.period}"] = minus_di
-        result[f"ADX_{self.period}"] = adx
+        self._store(result, out, f"Plus_DI_{self.period}", plus_di)
+        self._store(result, out, f"Minus_DI_{self.period}", minus_di)
+        self._store(result, out, f"ADX_{self.period}", adx)
 
         return result
 
@@ -239,9 +748,11 @@ class OnBalanceVolume(VolumeIndicator):
     - Works best with trends
     """
 
-    @property
+    accepts_arrays = True
+
+    @cached_property
     def metadata(self) -> IndicatorMetadata:
-        """Get OBV metadata."""
+        """Get OBV metadata (built once per instance)."""
         return IndicatorMetadata(
             name="On-Balance Volume",
             key="obv",
@@ -252,30 +763,29 @@ class OnBalanceVolume(VolumeIndicator):
             parameters=(),
         )
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate(
+        self,
+        df: pd.DataFrame,
+        arrays: Optional[OHLCVArrays] = None,
+        out: Optional[OutputBuffer] = None,
+    ) -> pd.DataFrame:
         """
         Calculate OBV.
 
         Args:
             df: Market data with Close and Volume columns.
+            arrays: Price arrays of `df` (extracted here when omitted).
+            out: Shared output buffer to write the columns into.
 
         Returns:
             DataFrame with OBV column.
         """
-        result = df.copy()
-
-        # Determine if close is up, down, or same
-        obv = pd.Series(0.0, index=df.index)
-
-        for i in range(1, len(result)):
-            if result["Close"].iloc[i] > result["Close"].iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] + result["Volume"].iloc[i]
-            elif result["Close"].iloc[i] < result["Close"].iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] - result["Volume"].iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i - 1]
+        result = df.copy(deep=False)
+        if arrays is None:
+            arrays = OHLCVArrays.from_frame(df)
 
-        result["OBV"] = obv
+        # Accumulated in float64, stored in the output dtype
+        self._store(result, out, "OBV", _on_balance_volume(arrays.close, arrays.volume))
         return result
 
 
@@ -302,6 +812,11 @@ class VolumeMovingAverage(VolumeIndicator):
     - Often used with volume threshold filters
     """
 
+    accepts_arrays = True
+
+    _rolling_means: Dict[int, Callable[[np.ndarray], np.ndarray]] = {}
+    """Compiled rolling-mean kernels by period, shared by all instances."""
+
     def __init__(self, period: int = 20):
         """
         Initialize Volume MA indicator.
@@ -317,9 +832,9 @@ class VolumeMovingAverage(VolumeIndicator):
 
         self.period = period
 
-    @property
+    @cached_property
     def metadata(self) -> IndicatorMetadata:
-        """Get Volume MA metadata."""
+        """Get Volume MA metadata (built once per instance)."""
         return IndicatorMetadata(
             name=f"Volume Moving Average ({self.period})",
             key=f"vol_ma_{self.period}",
@@ -330,22 +845,49 @@ class VolumeMovingAverage(VolumeIndicator):
             parameters=(("period", int, self.period),),
         )
 
-    def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate(
+        self,
+        df: pd.DataFrame,
+        arrays: Optional[OHLCVArrays] = None,
+        out: Optional[OutputBuffer] = None,
+    ) -> pd.DataFrame:
         """
         Calculate Volume MA.
 
         Args:
             df: Market data with Volume column.
+            arrays: Price arrays of `df` (extracted here when omitted).
+            out: Shared output buffer to write the columns into.
 
         Returns:
             DataFrame with Volume_MA column.
         """
-        result = df.copy()
+        result = df.copy(deep=False)
+        if arrays is None:
+            arrays = OHLCVArrays.from_frame(df)
         col_name = f"Volume_MA_{self.period}"
 
-        result[col_name] = result["Volume"].rolling(
-            window=self.period,
-            min_periods=1,
-        ).mean()
-
+        # bottleneck rejects windows longer than the input; shorter frames
+        # take the fallbacks below, which give partial means
+        if _BOTTLENECK_AVAILABLE and len(result) >= self.period:
+            # C-level incremental window sum, no Rolling object
+            volume_ma = bn.move_mean(
+                arrays.volume,
+                window=self.period,
+                min_count=1,
+            )
+        elif _NUMBA_AVAILABLE:
+            # Kernel specialized for this period, compiled once per process
+            rolling_mean = self._rolling_means.get(self.period)
+            if rolling_mean is None:
+                rolling_mean = _make_rolling_mean(self.period)
+                self._rolling_means[self.period] = rolling_mean
+            volume_ma = rolling_mean(arrays.volume)
+        else:
+            volume_ma = result["Volume"].rolling(
+                window=self.period,
+                min_periods=1,
+            ).mean().to_numpy()
+
+        self._store(result, out, col_name, volume_ma)
         return result
\ No newline at end of file
@@ -11,6 +11,7 @@ Exports:
     SignalFilter: Filters signals by various criteria.
     SignalSorter: Sorts signals by confidence, strength, etc.
     SignalValidator: Validates signal integrity.
+    SignalBatch: Columnar signal store for vectorized filtering.
 
 Detectors:
     MovingAverageCrossoverDetector: MA crossover signals.
@@ -18,6 +19,7 @@ Detectors:
     RSISignalDetector: RSI overbought/oversold signals.
     MACDSignalDetector: MACD crossover signals.
     StochasticSignalDetector: Stochastic oscillator signals.
+    run_momentum_batch: RSI/MACD/Stochastic detection over many symbols.
     FibonacciSignalDetector: Fibonacci level signals.
 """
 
@@ -31,6 +33,7 @@ from signals.base import (
     SignalFilter,
     SignalSorter,
 )
+from signals.signal_batch import SignalBatch
 from signals.aggregator import SignalAggregator, AggregationResult, DetectorFactory
 
 from signals.ma_signals import (
@@ -43,6 +46,7 @@ from signals.momentum_signals import (
     MACDSignalDetector,
     StochasticSignalDetector,
 )
+from signals.momentum_batch import run_momentum_batch
 from signals.fibonacci_signals import FibonacciLevels, FibonacciSignalDetector
 from signals.validator import (
     SignalValidator,
@@ -59,6 +63,7 @@ __all__ = [
     "SignalDetectorMetadata",
     "SignalFilter",
     "SignalSorter",
+    "SignalBatch",
     # Aggregation
     "SignalAggregator",
     "AggregationResult",
@@ -70,6 +75,7 @@ __all__ = [
     "RSISignalDetector",
     "MACDSignalDetector",
     "StochasticSignalDetector",
+    "run_momentum_batch",
     # Fibonacci
     "FibonacciLevels",
     "FibonacciSignalDetector",
@@ -7,6 +7,7 @@ ranking, and filtering.
 
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
+from datetime import datetime
 import pandas as pd
 from signals.base import Signal, SignalDetector, SignalFilter, SignalSorter
 from logging_config import get_logger
@@ -110,12 +111,13 @@ class SignalAggregator:
         all_signals = []
         detector_count = 0
         errors = []
+        now = datetime.now()
 
         # Execute each detector
         for detector in self.detectors:
             try:
                 logger.debug(f"Executing detector: {detector.metadata.name}")
-                signals = detector.execute(df)
+                signals = detector.execute(df, now=now)
                 all_signals.extend(signals)
                 detector_count += 1
 
@@ -6,10 +6,15 @@ Provides structures and interfaces for detecting and managing trading signals.
 
 from __future__ import annotations
 
+import math
+import weakref
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
+from datetime import datetime, timedelta
+from functools import cached_property
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Any
 import pandas as pd
 from logging_config import get_logger
 from exceptions import SignalDetectionError
@@ -18,6 +23,31 @@ from type_defs import SignalInfo
 logger = get_logger()
 
 
+# ============ SCALAR HELPERS ============
+
+_isfinite = math.isfinite
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """
+    Safely convert a scalar to float.
+
+    Uses ``math.isfinite`` rather than ``pd.isna``/``np.isinf`` since
+    detectors only ever pass scalars pulled from a single bar.
+
+    Args:
+        value: Scalar value (typically from ``df.iloc[-1]``).
+
+    Returns:
+        Finite float, or None for missing, infinite or non-numeric input.
+    """
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if _isfinite(f) else None
+
+
 # ============ SIGNAL STRENGTH CONSTANTS ============
 
 class SignalStrength:
@@ -102,21 +132,30 @@ class Signal:
     """Confidence score (0.0 to 1.0)."""
 
     timestamp: datetime = field(default_factory=datetime.now)
-    """When the signal was detected."""
+    """When the signal was detected (set once by the detector)."""
 
     indicator_name: Optional[str] = None
     """Name of indicator that generated signal."""
 
-    details: Dict[str, Any] = field(default_factory=dict)
-    """Additional context and details."""
+    details: Optional[Mapping[str, Any]] = None
+    """Additional context and details (None if the signal carries none)."""
 
     trading_implication: Optional[str] = None
     """Suggested trading action."""
 
+    @cached_property
+    def _timestamp_iso(self) -> str:
+        """ISO-8601 timestamp, formatted once per instance."""
+        return self.timestamp.isoformat()
+
     def to_dict(self) -> SignalInfo:
         """
         Convert to dictionary format.
 
+        Builds a new dict on every call, so callers may mutate it and it
+        reflects the current timeframe; only the timestamp string, fixed
+        when the signal is built, is cached.
+
         Returns:
             Dictionary representation of signal.
         """
@@ -128,9 +167,9 @@ class Signal:
             "timeframe": self.timeframe,
             "value": self.value,
             "confidence": self.confidence,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._timestamp_iso,
             "indicator_name": self.indicator_name,
-            "details": self.details,
+            "details": dict(self.details) if self.details else {},
             "trading_implication": self.trading_implication,
         }
 
@@ -179,7 +218,7 @@ class SignalDetector(ABC):
         ...             description="Custom signal detection"
         ...         )
         ...
-        ...     def detect(self, df: pd.DataFrame) -> List[Signal]:
+        ...     def detect(self, df: pd.DataFrame, now=None) -> List[Signal]:
         ...         signals = []
         ...         # Detection logic here
         ...         return signals
@@ -198,6 +237,12 @@ class SignalDetector(ABC):
         """
         pass
 
+    _safe_float = staticmethod(_safe_float)
+    """Shared scalar-to-float conversion for detector subclasses."""
+
+    _validated_columns: Optional[weakref.ref] = None
+    """Weak reference to the last column Index that passed validation."""
+
     def validate_input(self, df: pd.DataFrame) -> None:
         """
         Validate input data meets requirements.
@@ -206,62 +251,81 @@ class SignalDetector(ABC):
         - DataFrame is not empty
         - Has required columns
 
+        The column check is skipped when `df.columns` is the same Index
+        object that last passed; pandas replaces the Index whenever a
+        column is added or dropped, so identity implies the same columns.
+
         Args:
             df: Market data to validate.
 
         Raises:
             SignalDetectionError: If validation fails.
         """
-        meta = self.metadata
-
         # Check empty
         if df.empty:
+            meta = self.metadata
             raise SignalDetectionError(
                 f"Cannot detect {meta.name}: data is empty",
                 detector=meta.name,
             )
 
+        columns = df.columns
+        if self._validated_columns is not None and self._validated_columns() is columns:
+            return
+
         # Check required columns
-        required_cols = self._get_required_columns()
-        missing = required_cols - set(df.columns)
+        missing = {col for col in self._required_columns if col not in columns}
 
         if missing:
+            meta = self.metadata
             raise SignalDetectionError(
                 f"Cannot detect {meta.name}: missing columns {missing}",
                 detector=meta.name,
             )
 
+        self._validated_columns = weakref.ref(columns)
+
     @abstractmethod
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> Iterable[Signal]:
         """
         Detect signals in market data.
 
         Must be implemented by subclasses. Should:
         1. Validate input data
         2. Analyze indicators/prices
-        3. Generate Signal objects
-        4. Return list of signals
+        3. Generate Signal objects stamped with `now`
+        4. Return (or yield) the signals
 
         Args:
             df: Market data with indicators calculated.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
-            List of detected Signal objects.
+            Iterable of detected Signal objects (a list or a generator).
 
         Raises:
             SignalDetectionError: If detection fails.
         """
         pass
 
-    def execute(self, df: pd.DataFrame) -> List[Signal]:
+    def execute(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> List[Signal]:
         """
         Execute signal detection with validation.
 
         Public method that validates input and handles errors.
         Preferred over direct `detect()` call.
 
+        When `now` is given the detector stamps every signal with it, so
+        a caller running many detectors gets one consistent detection
+        time; otherwise the detector reads the clock once per run.
+
         Args:
             df: Market data DataFrame.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
             List of detected signals.
@@ -281,7 +345,7 @@ class SignalDetector(ABC):
 
             # Detect signals
             logger.debug(f"Detecting {meta.name}")
-            signals = self.detect(df)
+            signals = list(self.detect(df, now))
 
             logger.debug(f"Detected {len(signals)} signals from {meta.name}")
             return signals
@@ -295,6 +359,61 @@ class SignalDetector(ABC):
                 exception=e,
             ) from e
 
+    def execute_iter(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> Iterator[Signal]:
+        """
+        Execute signal detection lazily.
+
+        Same validation, timestamping and error handling as `execute()`,
+        but yields signals as the detector produces them so pipelines can
+        chain detectors without building a list per detector.
+
+        Args:
+            df: Market data DataFrame.
+            now: Detection time stamped on signals (default: current time).
+
+        Yields:
+            Detected signals.
+
+        Raises:
+            SignalDetectionError: If detection fails.
+
+        Example:
+            >>> stream = chain.from_iterable(d.execute_iter(df) for d in detectors)
+            >>> bullish = SignalFilter.by_bullish(stream)
+        """
+        meta = self.metadata
+
+        try:
+            self.validate_input(df)
+
+            logger.debug(f"Detecting {meta.name}")
+
+            yield from self.detect(df, now)
+
+        except SignalDetectionError:
+            raise
+        except Exception as e:
+            raise SignalDetectionError(
+                f"Error detecting {meta.name}: {str(e)}",
+                detector=meta.name,
+                exception=e,
+            ) from e
+
+    @cached_property
+    def _required_columns(self) -> FrozenSet[str]:
+        """
+        Required columns from metadata, computed once per detector.
+
+        Returns:
+            Frozen set of required column names.
+        """
+        meta = self.metadata
+        return frozenset(
+            {"Open", "High", "Low", "Close", "Volume", *meta.required_indicators}
+        )
+
     def _get_required_columns(self) -> Set[str]:
         """
         Get required columns from metadata.
@@ -302,10 +421,7 @@ class SignalDetector(ABC):
         Returns:
             Set of required column names.
         """
-        meta = self.metadata
-        required = {"Open", "High", "Low", "Close", "Volume"}
-        required.update(meta.required_indicators)
-        return required
+        return set(self._required_columns)
 
     def __str__(self) -> str:
         """Return string representation."""
@@ -359,12 +475,12 @@ class SignalFilter:
     """
 
     @staticmethod
-    def by_strength(signals: List[Signal], strength: str) -> List[Signal]:
+    def by_strength(signals: Iterable[Signal], strength: str) -> List[Signal]:
         """
         Filter signals by strength.
 
         Args:
-            signals: List of signals to filter.
+            signals: Signals to filter (any iterable).
             strength: Strength to match (e.g., 'BULLISH').
 
         Returns:
@@ -373,12 +489,12 @@ class SignalFilter:
         return [s for s in signals if s.strength == strength]
 
     @staticmethod
-    def by_bullish(signals: List[Signal]) -> List[Signal]:
+    def by_bullish(signals: Iterable[Signal]) -> List[Signal]:
         """
         Get all bullish signals.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
 
         Returns:
             Bullish signals only.
@@ -386,12 +502,12 @@ class SignalFilter:
         return [s for s in signals if s.is_bullish()]
 
     @staticmethod
-    def by_bearish(signals: List[Signal]) -> List[Signal]:
+    def by_bearish(signals: Iterable[Signal]) -> List[Signal]:
         """
         Get all bearish signals.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
 
         Returns:
             Bearish signals only.
@@ -399,12 +515,12 @@ class SignalFilter:
         return [s for s in signals if s.is_bearish()]
 
     @staticmethod
-    def by_category(signals: List[Signal], category: str) -> List[Signal]:
+    def by_category(signals: Iterable[Signal], category: str) -> List[Signal]:
         """
         Filter signals by category.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
             category: Category to match (e.g., 'MACD').
 
         Returns:
@@ -413,12 +529,12 @@ class SignalFilter:
         return [s for s in signals if s.category == category]
 
     @staticmethod
-    def by_confidence(signals: List[Signal], min_confidence: float) -> List[Signal]:
+    def by_confidence(signals: Iterable[Signal], min_confidence: float) -> List[Signal]:
         """
         Filter signals by confidence threshold.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
             min_confidence: Minimum confidence (0.0 to 1.0).
 
         Returns:
@@ -427,12 +543,12 @@ class SignalFilter:
         return [s for s in signals if s.confidence >= min_confidence]
 
     @staticmethod
-    def by_indicator(signals: List[Signal], indicator_name: str) -> List[Signal]:
+    def by_indicator(signals: Iterable[Signal], indicator_name: str) -> List[Signal]:
         """
         Filter signals by indicator name.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
             indicator_name: Indicator name to match.
 
         Returns:
@@ -441,12 +557,12 @@ class SignalFilter:
         return [s for s in signals if s.indicator_name == indicator_name]
 
     @staticmethod
-    def exclude_category(signals: List[Signal], category: str) -> List[Signal]:
+    def exclude_category(signals: Iterable[Signal], category: str) -> List[Signal]:
         """
         Exclude signals of a category.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
             category: Category to exclude.
 
         Returns:
@@ -455,24 +571,40 @@ class SignalFilter:
         return [s for s in signals if s.category != category]
 
     @staticmethod
-    def recent(signals: List[Signal], max_age_seconds: int) -> List[Signal]:
+    def recent(signals: Iterable[Signal], max_age_seconds: int) -> List[Signal]:
         """
         Filter for recent signals.
 
         Args:
-            signals: List of signals.
+            signals: Signals to filter (any iterable).
             max_age_seconds: Maximum age in seconds.
 
         Returns:
             Recent signals only.
         """
-        cutoff = datetime.now() - pd.Timedelta(seconds=max_age_seconds)
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
         return [s for s in signals if s.timestamp >= cutoff]
 
 
 # ============ SIGNAL SORTER ============
 
 
+_CONFIDENCE_KEY = attrgetter("confidence")
+_TIMESTAMP_KEY = attrgetter("timestamp")
+
+_STRENGTH_ORDER: Dict[str, int] = {
+    "EXTREME BULLISH": 0,
+    "STRONG BULLISH": 1,
+    "BULLISH": 2,
+    "MODERATE": 3,
+    "NEUTRAL": 4,
+    "BEARISH": 5,
+    "STRONG BEARISH": 6,
+    "EXTREME BEARISH": 7,
+}
+"""Sort rank per strength (strong bullish first, unknown last)."""
+
+
 class SignalSorter:
     """
     Sorts signals by various criteria.
@@ -490,7 +622,7 @@ class SignalSorter:
         Returns:
             Sorted list of signals.
         """
-        return sorted(signals, key=lambda s: s.confidence, reverse=not ascending)
+        return sorted(signals, key=_CONFIDENCE_KEY, reverse=not ascending)
 
     @staticmethod
     def by_timestamp(signals: List[Signal], ascending: bool = False) -> List[Signal]:
@@ -504,7 +636,7 @@ class SignalSorter:
         Returns:
             Sorted list of signals.
         """
-        return sorted(signals, key=lambda s: s.timestamp, reverse=not ascending)
+        return sorted(signals, key=_TIMESTAMP_KEY, reverse=not ascending)
 
     @staticmethod
     def by_strength(signals: List[Signal]) -> List[Signal]:
@@ -517,21 +649,8 @@ class SignalSorter:
         Returns:
             Sorted list with strong signals first.
         """
-        strength_order = {
-            "EXTREME BULLISH": 0,
-            "STRONG BULLISH": 1,
-            "BULLISH": 2,
-            "MODERATE": 3,
-            "NEUTRAL": 4,
-            "BEARISH": 5,
-            "STRONG BEARISH": 6,
-            "EXTREME BEARISH": 7,
-        }
-
-        return sorted(
-            signals,
-            key=lambda s: strength_order.get(s.strength, 99),
-        )
+        order = _STRENGTH_ORDER.get
+        return sorted(signals, key=lambda s: order(s.strength, 99))
 
     @staticmethod
     def by_category(signals: List[Signal]) -> Dict[str, List[Signal]]:
@@ -544,9 +663,7 @@ class SignalSorter:
         Returns:
             Dictionary mapping category to signals.
         """
-        grouped: Dict[str, List[Signal]] = {}
+        grouped: Dict[str, List[Signal]] = defaultdict(list)
         for signal in signals:
-            if signal.category not in grouped:
-                grouped[signal.category] = []
             grouped[signal.category].append(signal)
-        return grouped
\ No newline at end of file
+        return dict(grouped)
\ No newline at end of file
@@ -8,9 +8,9 @@ This is a comprehensive, clean implementation that replaces the broken
 Fibonacci signal code from the original analyzer.
 """
 
-from typing import List, Dict, Set, Tuple
+from datetime import datetime
+from typing import List, Dict, Optional, Set, Tuple
 import pandas as pd
-import numpy as np
 from signals.base import Signal, SignalDetector, SignalDetectorMetadata, SignalStrength
 from logging_config import get_logger
 
@@ -107,16 +107,18 @@ class FibonacciSignalDetector(SignalDetector):
             ),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(self, df: pd.DataFrame, now: Optional[datetime] = None) -> List[Signal]:
         """
         Detect Fibonacci signals.
 
         Args:
             df: Market data with OHLCV.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
             List of Fibonacci signals (0-100+ depending on patterns found).
         """
+        now = now or datetime.now()
         signals = []
 
         if len(df) < self.window:
@@ -140,14 +142,14 @@ class FibonacciSignalDetector(SignalDetector):
             levels = self._calculate_fib_levels(swing_low, swing_range)
 
             # Detect signals
-            signals.extend(self._detect_price_at_level(close, levels))
-            signals.extend(self._detect_bounces(df, levels))
-            signals.extend(self._detect_breaks(df, levels))
-            signals.extend(self._detect_channels(close, levels))
-            signals.extend(self._detect_confluence(close, levels))
-            signals.extend(self._detect_elliott_waves(df))
-            signals.extend(self._detect_time_zones(df))
-            signals.extend(self._detect_volume_confirmation(df, close, levels))
+            signals.extend(self._detect_price_at_level(close, levels, now))
+            signals.extend(self._detect_bounces(df, levels, now))
+            signals.extend(self._detect_breaks(df, levels, now))
+            signals.extend(self._detect_channels(close, levels, now))
+            signals.extend(self._detect_confluence(close, levels, now))
+            signals.extend(self._detect_elliott_waves(df, now))
+            signals.extend(self._detect_time_zones(df, now))
+            signals.extend(self._detect_volume_confirmation(df, close, levels, now))
 
             logger.debug(f"Detected {len(signals)} Fibonacci signals")
             return signals
@@ -183,7 +185,7 @@ class FibonacciSignalDetector(SignalDetector):
         return levels
 
     def _detect_price_at_level(
-        self, close: float, levels: Dict[str, Dict[str, float]]
+        self, close: float, levels: Dict[str, Dict[str, float]], now: datetime
     ) -> List[Signal]:
         """Detect when price is at a Fibonacci level."""
         signals = []
@@ -199,6 +201,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=strength,
                         description=f"Price at {level['name']} Fibonacci {level['type'].lower()}",
                         timeframe="unknown",
+                        timestamp=now,
                         value=level["price"],
                         confidence=0.7,
                         indicator_name="Fibonacci",
@@ -208,7 +211,9 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_bounces(self, df: pd.DataFrame, levels: Dict[str, Dict[str, float]]) -> List[Signal]:
+    def _detect_bounces(
+        self, df: pd.DataFrame, levels: Dict[str, Dict[str, float]], now: datetime
+    ) -> List[Signal]:
         """Detect bounces off Fibonacci levels."""
         signals = []
 
@@ -231,6 +236,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.BULLISH,
                         description=f"Bounce off {level['name']} Fibonacci level",
                         timeframe="unknown",
+                        timestamp=now,
                         value=level["price"],
                         confidence=0.65,
                         indicator_name="Fibonacci",
@@ -247,6 +253,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.BEARISH,
                         description=f"Rejection at {level['name']} Fibonacci level",
                         timeframe="unknown",
+                        timestamp=now,
                         value=level["price"],
                         confidence=0.65,
                         indicator_name="Fibonacci",
@@ -256,7 +263,9 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_breaks(self, df: pd.DataFrame, levels: Dict[str, Dict[str, float]]) -> List[Signal]:
+    def _detect_breaks(
+        self, df: pd.DataFrame, levels: Dict[str, Dict[str, float]], now: datetime
+    ) -> List[Signal]:
         """Detect breaks through Fibonacci levels."""
         signals = []
 
@@ -279,6 +288,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.STRONG_BULLISH,
                         description=f"Breaking through {level['name']} Fibonacci level",
                         timeframe="unknown",
+                        timestamp=now,
                         value=level["price"],
                         confidence=0.75,
                         indicator_name="Fibonacci",
@@ -295,6 +305,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.STRONG_BEARISH,
                         description=f"Breaking through {level['name']} Fibonacci level",
                         timeframe="unknown",
+                        timestamp=now,
                         value=level["price"],
                         confidence=0.75,
                         indicator_name="Fibonacci",
@@ -304,7 +315,9 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_channels(self, close: float, levels: Dict[str, Dict[str, float]]) -> List[Signal]:
+    def _detect_channels(
+        self, close: float, levels: Dict[str, Dict[str, float]], now: datetime
+    ) -> List[Signal]:
         """Detect Fibonacci channel/band signals."""
         signals = []
 
@@ -325,6 +338,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.NEUTRAL,
                         description=f"Price in Fibonacci channel between {lower['name']} and {upper['name']}",
                         timeframe="unknown",
+                        timestamp=now,
                         value=mid,
                         confidence=0.6,
                         indicator_name="Fibonacci",
@@ -334,7 +348,9 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_confluence(self, close: float, levels: Dict[str, Dict[str, float]]) -> List[Signal]:
+    def _detect_confluence(
+        self, close: float, levels: Dict[str, Dict[str, float]], now: datetime
+    ) -> List[Signal]:
         """Detect Fibonacci confluence (multiple levels close together)."""
         signals = []
 
@@ -366,6 +382,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=strength,
                         description=f"Fibonacci confluence at {len(cluster_names)} levels: {', '.join(cluster_names)}",
                         timeframe="unknown",
+                        timestamp=now,
                         value=cluster_price,
                         confidence=0.8,
                         indicator_name="Fibonacci",
@@ -375,7 +392,7 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_elliott_waves(self, df: pd.DataFrame) -> List[Signal]:
+    def _detect_elliott_waves(self, df: pd.DataFrame, now: datetime) -> List[Signal]:
         """Detect Elliott Wave Fibonacci patterns."""
         signals = []
 
@@ -399,6 +416,7 @@ class FibonacciSignalDetector(SignalDetector):
                             strength=SignalStrength.SIGNIFICANT,
                             description="Price at Elliott Wave 3 extension target (1.618x Wave 1)",
                             timeframe="unknown",
+                            timestamp=now,
                             value=wave3_target,
                             confidence=0.7,
                             indicator_name="Fibonacci",
@@ -409,7 +427,7 @@ class FibonacciSignalDetector(SignalDetector):
 
         return signals
 
-    def _detect_time_zones(self, df: pd.DataFrame) -> List[Signal]:
+    def _detect_time_zones(self, df: pd.DataFrame, now: datetime) -> List[Signal]:
         """Detect Fibonacci time zone signals."""
         signals = []
 
@@ -429,6 +447,7 @@ class FibonacciSignalDetector(SignalDetector):
                         strength=SignalStrength.MODERATE,
                         description=f"Current bar aligns with {fib_num}-bar Fibonacci time zone",
                         timeframe="unknown",
+                        timestamp=now,
                         value=float(fib_num),
                         confidence=0.6,
                         indicator_name="Fibonacci",
@@ -439,7 +458,11 @@ class FibonacciSignalDetector(SignalDetector):
         return signals
 
     def _detect_volume_confirmation(
-        self, df: pd.DataFrame, close: float, levels: Dict[str, Dict[str, float]]
+        self,
+        df: pd.DataFrame,
+        close: float,
+        levels: Dict[str, Dict[str, float]],
+        now: datetime,
     ) -> List[Signal]:
         """Detect Fibonacci levels with volume confirmation."""
         signals = []
@@ -472,6 +495,7 @@ class FibonacciSignalDetector(SignalDetector):
                             strength=SignalStrength.SIGNIFICANT,
                             description=f"Fibonacci {nearest_level[1]['name']} confirmed with {vol_ratio:.1f}x volume",
                             timeframe="unknown",
+                            timestamp=now,
                             value=nearest_level[1]["price"],
                             confidence=0.8,
                             indicator_name="Fibonacci",
@@ -501,13 +525,3 @@ class FibonacciSignalDetector(SignalDetector):
                 return SignalStrength.MODERATE
 
         return SignalStrength.MODERATE
-
-    @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
\ No newline at end of file
@@ -4,9 +4,9 @@ Moving Average signal detection.
 Detects signals from moving average crossovers and positioning.
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 import pandas as pd
-import numpy as np
 from signals.base import Signal, SignalDetector, SignalDetectorMetadata, SignalStrength
 from logging_config import get_logger
 
@@ -46,16 +46,18 @@ class MovingAverageCrossoverDetector(SignalDetector):
             signal_categories=("MA_BULL_CROSS", "MA_BEAR_CROSS"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(self, df: pd.DataFrame, now: Optional[datetime] = None) -> List[Signal]:
         """
         Detect MA crossover signals.
 
         Args:
             df: Market data with both MA columns.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
             List of crossover signals.
         """
+        now = now or datetime.now()
         signals = []
 
         fast_col = f"SMA_{self.fast_period}"
@@ -83,6 +85,7 @@ class MovingAverageCrossoverDetector(SignalDetector):
                         strength=SignalStrength.BULLISH,
                         description=f"{self.fast_period} MA crossed above {self.slow_period} MA",
                         timeframe="unknown",
+                        timestamp=now,
                         value=fast_curr,
                         confidence=0.7,
                         indicator_name="SMA",
@@ -99,6 +102,7 @@ class MovingAverageCrossoverDetector(SignalDetector):
                         strength=SignalStrength.BEARISH,
                         description=f"{self.fast_period} MA crossed below {self.slow_period} MA",
                         timeframe="unknown",
+                        timestamp=now,
                         value=fast_curr,
                         confidence=0.7,
                         indicator_name="SMA",
@@ -108,16 +112,6 @@ class MovingAverageCrossoverDetector(SignalDetector):
 
         return signals
 
-    @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
 
 # ============ MA POSITIONING DETECTOR ============
 
@@ -150,16 +144,18 @@ class MovingAveragePositioningDetector(SignalDetector):
             signal_categories=("MA_ABOVE", "MA_BELOW", "MA_ALIGNED"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(self, df: pd.DataFrame, now: Optional[datetime] = None) -> List[Signal]:
         """
         Detect MA positioning signals.
 
         Args:
             df: Market data with MA columns.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
             List of positioning signals.
         """
+        now = now or datetime.now()
         signals = []
 
         if len(df) < 1:
@@ -191,6 +187,7 @@ class MovingAveragePositioningDetector(SignalDetector):
                     strength=SignalStrength.BULLISH,
                     description=f"Price is above all moving averages: {self.periods}",
                     timeframe="unknown",
+                    timestamp=now,
                     value=close,
                     confidence=0.8,
                     indicator_name="SMA",
@@ -207,6 +204,7 @@ class MovingAveragePositioningDetector(SignalDetector):
                     strength=SignalStrength.BEARISH,
                     description=f"Price is below all moving averages: {self.periods}",
                     timeframe="unknown",
+                    timestamp=now,
                     value=close,
                     confidence=0.8,
                     indicator_name="SMA",
@@ -216,16 +214,6 @@ class MovingAveragePositioningDetector(SignalDetector):
 
         return signals
 
-    @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
 
 # ============ MA RIBBON DETECTOR ============
 
@@ -259,16 +247,18 @@ class MovingAverageRibbonDetector(SignalDetector):
             signal_categories=("RIBBON_ALIGNED", "RIBBON_SPREAD"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(self, df: pd.DataFrame, now: Optional[datetime] = None) -> List[Signal]:
         """
         Detect MA ribbon signals.
 
         Args:
             df: Market data with MA columns.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
             List of ribbon signals.
         """
+        now = now or datetime.now()
         signals = []
 
         if len(df) < 1:
@@ -315,6 +305,7 @@ class MovingAverageRibbonDetector(SignalDetector):
                     strength=strength,
                     description=f"All {len(self.periods)} MAs are tightly aligned",
                     timeframe="unknown",
+                    timestamp=now,
                     value=spread_ratio,
                     confidence=0.85,
                     indicator_name="SMA",
@@ -331,6 +322,7 @@ class MovingAverageRibbonDetector(SignalDetector):
                     strength=SignalStrength.NEUTRAL,
                     description=f"MAs are spread apart (weak trend or transition)",
                     timeframe="unknown",
+                    timestamp=now,
                     value=spread_ratio,
                     confidence=0.6,
                     indicator_name="SMA",
@@ -339,13 +331,3 @@ class MovingAverageRibbonDetector(SignalDetector):
             )
 
         return signals
-
-    @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+Batch momentum signal detection across many symbols.
+
+Packs the last two bars of RSI/MACD/Stochastic values for every symbol
+into one matrix and classifies all rows in a single compiled kernel,
+parallel over symbols. Signal objects are only built afterwards, in
+Python, for the conditions that actually fired.
+
+Numba is optional: without it the same kernel runs as plain Python.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from signals.base import Signal
+from signals.momentum_signals import (
+    RSISignalDetector,
+    MACDSignalDetector,
+    StochasticSignalDetector,
+)
+from logging_config import get_logger
+
+logger = get_logger()
+
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ============ PACKED LAYOUT ============
+
+# Columns of the packed input matrix (one row per symbol)
+_RSI = 0
+_MACD_CURR = 1
+_MACD_PREV = 2
+_SIG_CURR = 3
+_SIG_PREV = 4
+_HIST = 5
+_K_CURR = 6
+_K_PREV = 7
+_D_CURR = 8
+_D_PREV = 9
+_N_INPUTS = 10
+
+# Columns of the output code matrix; 0 means "no signal" in every column
+_RSI_CODE = 0  # 1 oversold, 2 overbought, 3 neutral zone
+_MACD_CROSS_CODE = 1  # 1 bull cross, 2 bear cross
+_MACD_ZERO_CODE = 2  # 1 zero cross up, 2 zero cross down
+_STOCH_LEVEL_CODE = 3  # 1 oversold, 2 overbought
+_STOCH_CROSS_CODE = 4  # 1 %K above %D, 2 %K below %D
+_N_CODES = 5
+
+
+# ============ KERNELS ============
+
+
+@njit(cache=True)
+def _per_row(x, rsi_oversold, rsi_overbought, stoch_oversold, stoch_overbought, out):
+    """Classify one symbol's packed values into `out` (mirrors the detectors)."""
+    rsi = x[_RSI]
+    if np.isfinite(rsi):
+        if rsi < rsi_oversold:
+            out[_RSI_CODE] = 1
+        elif rsi > rsi_overbought:
+            out[_RSI_CODE] = 2
+        elif rsi >= 40.0 and rsi <= 60.0:
+            out[_RSI_CODE] = 3
+
+    macd_curr = x[_MACD_CURR]
+    macd_prev = x[_MACD_PREV]
+    sig_curr = x[_SIG_CURR]
+    sig_prev = x[_SIG_PREV]
+    if (
+        np.isfinite(macd_curr)
+        and np.isfinite(macd_prev)
+        and np.isfinite(sig_curr)
+        and np.isfinite(sig_prev)
+    ):
+        if macd_prev <= sig_prev and macd_curr > sig_curr:
+            out[_MACD_CROSS_CODE] = 1
+        elif macd_prev >= sig_prev and macd_curr < sig_curr:
+            out[_MACD_CROSS_CODE] = 2
+
+        if macd_prev < 0.0 and macd_curr > 0.0:
+            out[_MACD_ZERO_CODE] = 1
+        elif macd_prev > 0.0 and macd_curr < 0.0:
+            out[_MACD_ZERO_CODE] = 2
+
+    k_curr = x[_K_CURR]
+    d_curr = x[_D_CURR]
+    if np.isfinite(k_curr) and np.isfinite(d_curr):
+        if k_curr < stoch_oversold:
+            out[_STOCH_LEVEL_CODE] = 1
+        elif k_curr > stoch_overbought:
+            out[_STOCH_LEVEL_CODE] = 2
+
+        k_prev = x[_K_PREV]
+        d_prev = x[_D_PREV]
+        if np.isfinite(k_prev) and np.isfinite(d_prev):
+            if k_prev <= d_prev and k_curr > d_curr:
+                out[_STOCH_CROSS_CODE] = 1
+            elif k_prev >= d_prev and k_curr < d_curr:
+                out[_STOCH_CROSS_CODE] = 2
+
+
+@njit(cache=True, parallel=True)
+def _classify(X, rsi_oversold, rsi_overbought, stoch_oversold, stoch_overbought, codes):
+    """Classify every row of `X` into `codes`, parallel over symbols."""
+    for i in prange(X.shape[0]):
+        _per_row(
+            X[i], rsi_oversold, rsi_overbought, stoch_oversold, stoch_overbought, codes[i]
+        )
+
+
+# ============ PACKING ============
+
+
+def _column_tail(df: pd.DataFrame, column: str, bars: int) -> np.ndarray:
+    """
+    Last `bars` values of a column, NaN-padded on the left.
+
+    Missing columns and short frames yield NaN, which the kernel treats
+    as "no signal" just like the detectors' early returns.
+    """
+    out = np.full(bars, np.nan)
+    if column not in df.columns or len(df) == 0:
+        return out
+
+    values = pd.to_numeric(df[column].iloc[-bars:], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    out[bars - len(values):] = values
+    return out
+
+
+def _pack(
+    panels: Dict[str, pd.DataFrame],
+    rsi: RSISignalDetector,
+) -> np.ndarray:
+    """
+    Pack the last two bars of each symbol's indicators into a matrix.
+
+    Args:
+        panels: Symbol → indicator DataFrame.
+        rsi: RSI detector (its period selects the RSI column).
+
+    Returns:
+        float64 array of shape (n_symbols, _N_INPUTS).
+    """
+    X = np.full((len(panels), _N_INPUTS), np.nan)
+    rsi_col = f"RSI_{rsi.period}"
+
+    for i, df in enumerate(panels.values()):
+        X[i, _RSI] = _column_tail(df, rsi_col, 1)[0]
+
+        # MACD and Stochastic detectors need two bars
+        if len(df) < 2:
+            continue
+
+        X[i, _MACD_PREV], X[i, _MACD_CURR] = _column_tail(df, "MACD", 2)
+        X[i, _SIG_PREV], X[i, _SIG_CURR] = _column_tail(df, "MACD_Signal", 2)
+        X[i, _HIST] = _column_tail(df, "MACD_Histogram", 1)[0]
+        X[i, _K_PREV], X[i, _K_CURR] = _column_tail(df, "Stoch_K", 2)
+        X[i, _D_PREV], X[i, _D_CURR] = _column_tail(df, "Stoch_D", 2)
+
+    return X
+
+
+# ============ BATCH ENTRY POINT ============
+
+
+def run_momentum_batch(
+    panels: Dict[str, pd.DataFrame],
+    rsi: Optional[RSISignalDetector] = None,
+    macd: Optional[MACDSignalDetector] = None,
+    stochastic: Optional[StochasticSignalDetector] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, List[Signal]]:
+    """
+    Run RSI, MACD and Stochastic detection over many symbols at once.
+
+    Produces the same signals, in the same order, as calling each
+    detector's `execute()` per symbol, except that symbols missing an
+    indicator column simply get no signal for it instead of an error.
+
+    Args:
+        panels: Symbol → DataFrame with indicators calculated.
+        rsi: RSI detector providing period/thresholds (default: RSI(14)).
+        macd: MACD detector (default: MACDSignalDetector()).
+        stochastic: Stochastic detector providing thresholds (default: 14).
+        now: Detection time stamped on every signal (default: current time).
+
+    Returns:
+        Symbol → list of detected signals.
+
+    Example:
+        >>> frames = {"SPY": spy_df, "QQQ": qqq_df}
+        >>> signals = run_momentum_batch(frames)
+        >>> signals["SPY"]
+    """
+    rsi = rsi or RSISignalDetector()
+    macd = macd or MACDSignalDetector()
+    stochastic = stochastic or StochasticSignalDetector()
+    stamp = now or datetime.now()
+
+    symbols = list(panels)
+    X = _pack(panels, rsi)
+    codes = np.zeros((len(symbols), _N_CODES), dtype=np.int8)
+
+    _classify(
+        X,
+        float(rsi.oversold),
+        float(rsi.overbought),
+        float(stochastic.oversold),
+        float(stochastic.overbought),
+        codes,
+    )
+
+    results: Dict[str, List[Signal]] = {symbol: [] for symbol in symbols}
+
+    # Only rows where something fired need Python-side Signal objects
+    for i in np.flatnonzero(codes.any(axis=1)):
+        x = X[i]
+        row = codes[i]
+        signals = results[symbols[i]]
+
+        rsi_code = row[_RSI_CODE]
+        if rsi_code:
+            value = float(x[_RSI])
+            if rsi_code == 1:
+                signals.append(rsi._oversold_signal(value, stamp))
+            elif rsi_code == 2:
+                signals.append(rsi._overbought_signal(value, stamp))
+            else:
+                signals.append(rsi._neutral_zone_signal(value, stamp))
+
+        macd_value = float(x[_MACD_CURR])
+        histogram = float(x[_HIST]) if np.isfinite(x[_HIST]) else None
+        if row[_MACD_CROSS_CODE] == 1:
+            signals.append(macd._bull_cross_signal(macd_value, histogram, stamp))
+        elif row[_MACD_CROSS_CODE] == 2:
+            signals.append(macd._bear_cross_signal(macd_value, histogram, stamp))
+
+        if row[_MACD_ZERO_CODE] == 1:
+            signals.append(macd._zero_cross_up_signal(macd_value, stamp))
+        elif row[_MACD_ZERO_CODE] == 2:
+            signals.append(macd._zero_cross_down_signal(macd_value, stamp))
+
+        k_value = float(x[_K_CURR])
+        if row[_STOCH_LEVEL_CODE] == 1:
+            signals.append(stochastic._oversold_signal(k_value, stamp))
+        elif row[_STOCH_LEVEL_CODE] == 2:
+            signals.append(stochastic._overbought_signal(k_value, stamp))
+
+        if row[_STOCH_CROSS_CODE] == 1:
+            signals.append(stochastic._cross_above_signal(k_value, stamp))
+        elif row[_STOCH_CROSS_CODE] == 2:
+            signals.append(stochastic._cross_below_signal(k_value, stamp))
+
+    logger.debug(
+        f"Momentum batch: {len(symbols)} symbols, "
+        f"{sum(len(s) for s in results.values())} signals "
+        f"(numba={'on' if _NUMBA_AVAILABLE else 'off'})"
+    )
+
+    return results
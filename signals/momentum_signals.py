@@ -4,10 +4,16 @@ Momentum signal detection.
 Detects signals from RSI, MACD, and Stochastic indicators.
 """
 
-from typing import List
+from datetime import datetime
+from typing import Iterator, Optional
 import pandas as pd
 import numpy as np
-from signals.base import Signal, SignalDetector, SignalDetectorMetadata, SignalStrength
+from signals.base import (
+    Signal,
+    SignalDetector,
+    SignalDetectorMetadata,
+    SignalStrength,
+)
 from logging_config import get_logger
 
 logger = get_logger()
@@ -47,96 +53,141 @@ class RSISignalDetector(SignalDetector):
             signal_categories=("RSI_OVERSOLD", "RSI_OVERBOUGHT"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> Iterator[Signal]:
         """
         Detect RSI signals.
 
         Args:
             df: Market data with RSI column.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
-            List of RSI signals.
+            Generator of RSI signals.
         """
-        signals = []
-
+        now = now or datetime.now()
         if len(df) < 1:
-            return signals
+            return
 
         current = df.iloc[-1]
         rsi_col = f"RSI_{self.period}"
         rsi = self._safe_float(current[rsi_col])
 
         if rsi is None:
-            return signals
+            return
 
         # Oversold (bullish potential)
         if rsi < self.oversold:
-            signals.append(
-                Signal(
-                    name=f"RSI OVERSOLD",
-                    category="RSI",
-                    strength=SignalStrength.BULLISH,
-                    description=f"RSI({self.period}): {rsi:.1f} < {self.oversold} (Oversold)",
-                    timeframe="unknown",
-                    value=rsi,
-                    confidence=0.65,
-                    indicator_name="RSI",
-                    trading_implication="Potential reversal zone; watch for support bounces",
-                )
-            )
+            yield self._oversold_signal(rsi, now)
 
         # Overbought (bearish potential)
         elif rsi > self.overbought:
-            signals.append(
-                Signal(
-                    name=f"RSI OVERBOUGHT",
-                    category="RSI",
-                    strength=SignalStrength.BEARISH,
-                    description=f"RSI({self.period}): {rsi:.1f} > {self.overbought} (Overbought)",
-                    timeframe="unknown",
-                    value=rsi,
-                    confidence=0.65,
-                    indicator_name="RSI",
-                    trading_implication="Potential reversal or pullback; watch for resistance",
-                )
-            )
+            yield self._overbought_signal(rsi, now)
 
         # Neutral zone
         elif 40 <= rsi <= 60:
-            if rsi > 55:
-                strength = SignalStrength.MODERATE
-                desc = f"RSI trending into overbought: {rsi:.1f}"
-            elif rsi < 45:
-                strength = SignalStrength.MODERATE
-                desc = f"RSI trending into oversold: {rsi:.1f}"
-            else:
-                strength = SignalStrength.NEUTRAL
-                desc = f"RSI in neutral zone: {rsi:.1f}"
-
-            signals.append(
-                Signal(
-                    name="RSI NEUTRAL",
-                    category="RSI",
-                    strength=strength,
-                    description=desc,
-                    timeframe="unknown",
-                    value=rsi,
-                    confidence=0.5,
-                    indicator_name="RSI",
-                )
-            )
-
-        return signals
+            yield self._neutral_zone_signal(rsi, now)
 
-    @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+    # Zone codes returned by detect_series()
+    ZONE_NONE = 0
+    ZONE_OVERSOLD = 1
+    ZONE_OVERBOUGHT = 2
+    ZONE_TRENDING_OVERBOUGHT = 3
+    ZONE_TRENDING_OVERSOLD = 4
+    ZONE_NEUTRAL = 5
+
+    # np.digitize bin index (0..6) -> zone code
+    _ZONE_LOOKUP = np.array([1, 0, 4, 5, 3, 0, 2], dtype=np.int8)
+
+    def detect_series(self, rsi: np.ndarray) -> np.ndarray:
+        """
+        Classify a whole RSI series into zone codes.
+
+        Vectorized equivalent of the per-bar rules in `detect()` for
+        backtests: one `np.digitize` call over all bars instead of the
+        if/elif chain per bar. Bins on the upper side are nudged up by
+        one ulp so that 55, 60 and `overbought` fall in the same zone as
+        the inclusive/strict comparisons in `detect()`.
+
+        Args:
+            rsi: RSI values, one per bar.
+
+        Returns:
+            int8 array of ZONE_* codes; non-finite input maps to ZONE_NONE.
+        """
+        values = np.asarray(rsi, dtype=np.float64)
+
+        # Oversold/overbought take precedence over the 40-60 band
+        lower = np.array(
+            [self.oversold, max(40, self.oversold), max(45, self.oversold)],
+            dtype=np.float64,
+        )
+        upper = np.array(
+            [min(55, self.overbought), min(60, self.overbought), self.overbought],
+            dtype=np.float64,
+        )
+        bins = np.maximum.accumulate(
+            np.concatenate((lower, np.nextafter(upper, np.inf)))
+        )
+
+        codes = self._ZONE_LOOKUP[np.digitize(values, bins)]
+        codes[~np.isfinite(values)] = self.ZONE_NONE
+        return codes
+
+    def _oversold_signal(self, rsi: float, now: datetime) -> Signal:
+        """Build the RSI oversold signal."""
+        return Signal(
+            name=f"RSI OVERSOLD",
+            category="RSI",
+            strength=SignalStrength.BULLISH,
+            description=f"RSI({self.period}): {rsi:.1f} < {self.oversold} (Oversold)",
+            timeframe="unknown",
+            timestamp=now,
+            value=rsi,
+            confidence=0.65,
+            indicator_name="RSI",
+            trading_implication="Potential reversal zone; watch for support bounces",
+        )
+
+    def _overbought_signal(self, rsi: float, now: datetime) -> Signal:
+        """Build the RSI overbought signal."""
+        return Signal(
+            name=f"RSI OVERBOUGHT",
+            category="RSI",
+            strength=SignalStrength.BEARISH,
+            description=f"RSI({self.period}): {rsi:.1f} > {self.overbought} (Overbought)",
+            timeframe="unknown",
+            timestamp=now,
+            value=rsi,
+            confidence=0.65,
+            indicator_name="RSI",
+            trading_implication="Potential reversal or pullback; watch for resistance",
+        )
+
+    def _neutral_zone_signal(self, rsi: float, now: datetime) -> Signal:
+        """Build the RSI neutral-zone signal (40-60)."""
+        if rsi > 55:
+            strength = SignalStrength.MODERATE
+            desc = f"RSI trending into overbought: {rsi:.1f}"
+        elif rsi < 45:
+            strength = SignalStrength.MODERATE
+            desc = f"RSI trending into oversold: {rsi:.1f}"
+        else:
+            strength = SignalStrength.NEUTRAL
+            desc = f"RSI in neutral zone: {rsi:.1f}"
+
+        return Signal(
+            name="RSI NEUTRAL",
+            category="RSI",
+            strength=strength,
+            description=desc,
+            timeframe="unknown",
+            timestamp=now,
+            value=rsi,
+            confidence=0.5,
+            indicator_name="RSI",
+        )
 
 
 # ============ MACD SIGNAL DETECTOR ============
@@ -160,20 +211,22 @@ class MACDSignalDetector(SignalDetector):
             signal_categories=("MACD_BULL_CROSS", "MACD_BEAR_CROSS"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> Iterator[Signal]:
         """
         Detect MACD signals.
 
         Args:
             df: Market data with MACD columns.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
-            List of MACD signals.
+            Generator of MACD signals.
         """
-        signals = []
-
+        now = now or datetime.now()
         if len(df) < 2:
-            return signals
+            return
 
         current = df.iloc[-1]
         previous = df.iloc[-2]
@@ -185,84 +238,92 @@ class MACDSignalDetector(SignalDetector):
         histogram_curr = self._safe_float(current.get("MACD_Histogram"))
 
         if not all(v is not None for v in [macd_curr, signal_curr, macd_prev, signal_prev]):
-            return signals
+            return
 
         # Bullish crossover
         if macd_prev <= signal_prev and macd_curr > signal_curr:
-            signals.append(
-                Signal(
-                    name="MACD BULL CROSS",
-                    category="MACD",
-                    strength=SignalStrength.STRONG_BULLISH,
-                    description="MACD crossed above signal line",
-                    timeframe="unknown",
-                    value=macd_curr,
-                    confidence=0.8,
-                    indicator_name="MACD",
-                    details={"histogram": histogram_curr} if histogram_curr else {},
-                    trading_implication="Strong buy signal; consider entering long positions",
-                )
-            )
+            yield self._bull_cross_signal(macd_curr, histogram_curr, now)
 
         # Bearish crossover
         elif macd_prev >= signal_prev and macd_curr < signal_curr:
-            signals.append(
-                Signal(
-                    name="MACD BEAR CROSS",
-                    category="MACD",
-                    strength=SignalStrength.STRONG_BEARISH,
-                    description="MACD crossed below signal line",
-                    timeframe="unknown",
-                    value=macd_curr,
-                    confidence=0.8,
-                    indicator_name="MACD",
-                    details={"histogram": histogram_curr} if histogram_curr else {},
-                    trading_implication="Strong sell signal; consider exiting longs or entering shorts",
-                )
-            )
+            yield self._bear_cross_signal(macd_curr, histogram_curr, now)
 
         # MACD zero crossing (additional signal)
         if macd_prev < 0 and macd_curr > 0:
-            signals.append(
-                Signal(
-                    name="MACD ZERO CROSS UP",
-                    category="MACD",
-                    strength=SignalStrength.MODERATE,
-                    description="MACD crossed above zero",
-                    timeframe="unknown",
-                    value=macd_curr,
-                    confidence=0.7,
-                    indicator_name="MACD",
-                    trading_implication="Momentum turning positive",
-                )
-            )
+            yield self._zero_cross_up_signal(macd_curr, now)
 
         elif macd_prev > 0 and macd_curr < 0:
-            signals.append(
-                Signal(
-                    name="MACD ZERO CROSS DOWN",
-                    category="MACD",
-                    strength=SignalStrength.MODERATE,
-                    description="MACD crossed below zero",
-                    timeframe="unknown",
-                    value=macd_curr,
-                    confidence=0.7,
-                    indicator_name="MACD",
-                    trading_implication="Momentum turning negative",
-                )
-            )
-
-        return signals
+            yield self._zero_cross_down_signal(macd_curr, now)
 
     @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
+    def _bull_cross_signal(
+        macd: float, histogram: Optional[float], now: datetime
+    ) -> Signal:
+        """Build the MACD bullish signal-line crossover signal."""
+        return Signal(
+            name="MACD BULL CROSS",
+            category="MACD",
+            strength=SignalStrength.STRONG_BULLISH,
+            description="MACD crossed above signal line",
+            timeframe="unknown",
+            timestamp=now,
+            value=macd,
+            confidence=0.8,
+            indicator_name="MACD",
+            details={"histogram": histogram} if histogram else None,
+            trading_implication="Strong buy signal; consider entering long positions",
+        )
+
+    @staticmethod
+    def _bear_cross_signal(
+        macd: float, histogram: Optional[float], now: datetime
+    ) -> Signal:
+        """Build the MACD bearish signal-line crossover signal."""
+        return Signal(
+            name="MACD BEAR CROSS",
+            category="MACD",
+            strength=SignalStrength.STRONG_BEARISH,
+            description="MACD crossed below signal line",
+            timeframe="unknown",
+            timestamp=now,
+            value=macd,
+            confidence=0.8,
+            indicator_name="MACD",
+            details={"histogram": histogram} if histogram else None,
+            trading_implication="Strong sell signal; consider exiting longs or entering shorts",
+        )
+
+    @staticmethod
+    def _zero_cross_up_signal(macd: float, now: datetime) -> Signal:
+        """Build the MACD upward zero-line crossing signal."""
+        return Signal(
+            name="MACD ZERO CROSS UP",
+            category="MACD",
+            strength=SignalStrength.MODERATE,
+            description="MACD crossed above zero",
+            timeframe="unknown",
+            timestamp=now,
+            value=macd,
+            confidence=0.7,
+            indicator_name="MACD",
+            trading_implication="Momentum turning positive",
+        )
+
+    @staticmethod
+    def _zero_cross_down_signal(macd: float, now: datetime) -> Signal:
+        """Build the MACD downward zero-line crossing signal."""
+        return Signal(
+            name="MACD ZERO CROSS DOWN",
+            category="MACD",
+            strength=SignalStrength.MODERATE,
+            description="MACD crossed below zero",
+            timeframe="unknown",
+            timestamp=now,
+            value=macd,
+            confidence=0.7,
+            indicator_name="MACD",
+            trading_implication="Momentum turning negative",
+        )
 
 
 # ============ STOCHASTIC SIGNAL DETECTOR ============
@@ -299,105 +360,117 @@ class StochasticSignalDetector(SignalDetector):
             signal_categories=("STOCH_OVERSOLD", "STOCH_OVERBOUGHT", "STOCH_CROSS"),
         )
 
-    def detect(self, df: pd.DataFrame) -> List[Signal]:
+    def detect(
+        self, df: pd.DataFrame, now: Optional[datetime] = None
+    ) -> Iterator[Signal]:
         """
         Detect Stochastic signals.
 
         Args:
             df: Market data with Stochastic columns.
+            now: Detection time stamped on signals (default: current time).
 
         Returns:
-            List of Stochastic signals.
+            Generator of Stochastic signals.
         """
-        signals = []
-
+        now = now or datetime.now()
         if len(df) < 2:
-            return signals
+            return
 
-        current = df.iloc[-1]
-        k_curr = self._safe_float(current.get("Stoch_K"))
-        d_curr = self._safe_float(current.get("Stoch_D"))
+        # Resolve column positions once and pull the last two bars as a
+        # single 2x2 block instead of going through per-row Series lookups
+        cols = df.columns
+        try:
+            k_idx = cols.get_loc("Stoch_K")
+            d_idx = cols.get_loc("Stoch_D")
+        except KeyError:
+            return
+
+        tail = df.iloc[-2:, [k_idx, d_idx]].to_numpy()
+        k_curr = self._safe_float(tail[-1, 0])
+        d_curr = self._safe_float(tail[-1, 1])
 
         if k_curr is None or d_curr is None:
-            return signals
+            return
 
         # Oversold
         if k_curr < self.oversold:
-            signals.append(
-                Signal(
-                    name="STOCHASTIC OVERSOLD",
-                    category="STOCHASTIC",
-                    strength=SignalStrength.BULLISH,
-                    description=f"Stochastic %K: {k_curr:.1f} < {self.oversold} (Oversold)",
-                    timeframe="unknown",
-                    value=k_curr,
-                    confidence=0.65,
-                    indicator_name="Stochastic",
-                    trading_implication="Oversold condition; potential reversal",
-                )
-            )
+            yield self._oversold_signal(k_curr, now)
 
         # Overbought
         elif k_curr > self.overbought:
-            signals.append(
-                Signal(
-                    name="STOCHASTIC OVERBOUGHT",
-                    category="STOCHASTIC",
-                    strength=SignalStrength.BEARISH,
-                    description=f"Stochastic %K: {k_curr:.1f} > {self.overbought} (Overbought)",
-                    timeframe="unknown",
-                    value=k_curr,
-                    confidence=0.65,
-                    indicator_name="Stochastic",
-                    trading_implication="Overbought condition; potential reversal",
-                )
-            )
+            yield self._overbought_signal(k_curr, now)
 
         # %K/%D crossover
         if len(df) >= 2:
-            previous = df.iloc[-2]
-            k_prev = self._safe_float(previous.get("Stoch_K"))
-            d_prev = self._safe_float(previous.get("Stoch_D"))
+            k_prev = self._safe_float(tail[-2, 0])
+            d_prev = self._safe_float(tail[-2, 1])
 
             if k_prev is not None and d_prev is not None:
                 if k_prev <= d_prev and k_curr > d_curr:
-                    signals.append(
-                        Signal(
-                            name="STOCHASTIC %K CROSS ABOVE %D",
-                            category="STOCHASTIC",
-                            strength=SignalStrength.BULLISH,
-                            description="%K crossed above %D",
-                            timeframe="unknown",
-                            value=k_curr,
-                            confidence=0.7,
-                            indicator_name="Stochastic",
-                            trading_implication="Bullish momentum; consider long entry",
-                        )
-                    )
+                    yield self._cross_above_signal(k_curr, now)
 
                 elif k_prev >= d_prev and k_curr < d_curr:
-                    signals.append(
-                        Signal(
-                            name="STOCHASTIC %K CROSS BELOW %D",
-                            category="STOCHASTIC",
-                            strength=SignalStrength.BEARISH,
-                            description="%K crossed below %D",
-                            timeframe="unknown",
-                            value=k_curr,
-                            confidence=0.7,
-                            indicator_name="Stochastic",
-                            trading_implication="Bearish momentum; consider short entry",
-                        )
-                    )
-
-        return signals
+                    yield self._cross_below_signal(k_curr, now)
+
+    def _oversold_signal(self, k: float, now: datetime) -> Signal:
+        """Build the Stochastic oversold signal."""
+        return Signal(
+            name="STOCHASTIC OVERSOLD",
+            category="STOCHASTIC",
+            strength=SignalStrength.BULLISH,
+            description=f"Stochastic %K: {k:.1f} < {self.oversold} (Oversold)",
+            timeframe="unknown",
+            timestamp=now,
+            value=k,
+            confidence=0.65,
+            indicator_name="Stochastic",
+            trading_implication="Oversold condition; potential reversal",
+        )
+
+    def _overbought_signal(self, k: float, now: datetime) -> Signal:
+        """Build the Stochastic overbought signal."""
+        return Signal(
+            name="STOCHASTIC OVERBOUGHT",
+            category="STOCHASTIC",
+            strength=SignalStrength.BEARISH,
+            description=f"Stochastic %K: {k:.1f} > {self.overbought} (Overbought)",
+            timeframe="unknown",
+            timestamp=now,
+            value=k,
+            confidence=0.65,
+            indicator_name="Stochastic",
+            trading_implication="Overbought condition; potential reversal",
+        )
 
     @staticmethod
-    def _safe_float(value) -> float:
-        """Safely convert to float, return None for invalid."""
-        try:
-            if pd.isna(value) or np.isinf(value):
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
\ No newline at end of file
+    def _cross_above_signal(k: float, now: datetime) -> Signal:
+        """Build the %K-crosses-above-%D signal."""
+        return Signal(
+            name="STOCHASTIC %K CROSS ABOVE %D",
+            category="STOCHASTIC",
+            strength=SignalStrength.BULLISH,
+            description="%K crossed above %D",
+            timeframe="unknown",
+            timestamp=now,
+            value=k,
+            confidence=0.7,
+            indicator_name="Stochastic",
+            trading_implication="Bullish momentum; consider long entry",
+        )
+
+    @staticmethod
+    def _cross_below_signal(k: float, now: datetime) -> Signal:
+        """Build the %K-crosses-below-%D signal."""
+        return Signal(
+            name="STOCHASTIC %K CROSS BELOW %D",
+            category="STOCHASTIC",
+            strength=SignalStrength.BEARISH,
+            description="%K crossed below %D",
+            timeframe="unknown",
+            timestamp=now,
+            value=k,
+            confidence=0.7,
+            indicator_name="Stochastic",
+            trading_implication="Bearish momentum; consider short entry",
+        )
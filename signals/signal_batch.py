@@ -0,0 +1,205 @@
+"""
+Columnar signal storage.
+
+Holds a collection of signals as parallel arrays so large scans can be
+filtered and sorted with vectorized numpy operations instead of
+per-object Python loops.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Union
+import numpy as np
+import pandas as pd
+
+from signals.base import Signal, SignalStrength
+
+
+# ============ SIGNAL BATCH ============
+
+
+@dataclass(frozen=True)
+class SignalBatch:
+    """
+    Structure-of-arrays view over a list of signals.
+
+    Each field is an array aligned by position, so a filter is a single
+    boolean mask applied to every column. The original Signal objects
+    are kept alongside and only handed back by `to_list()`.
+
+    Example:
+        >>> batch = SignalBatch.from_signals(result.signals)
+        >>> strong = batch.by_confidence(0.7).by_category("MACD")
+        >>> signals = strong.to_list()
+    """
+
+    signals: np.ndarray
+    """Object array of the underlying Signal instances."""
+
+    names: np.ndarray
+    """Signal names."""
+
+    categories: pd.Categorical
+    """Signal categories."""
+
+    strengths: pd.Categorical
+    """Signal strengths."""
+
+    confidences: np.ndarray
+    """Confidence scores (float64, so thresholds compare exactly)."""
+
+    timestamps: np.ndarray
+    """Detection times as datetime64 (NaT when unstamped)."""
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Signal]) -> SignalBatch:
+        """
+        Build a batch from Signal objects.
+
+        Args:
+            signals: Signals to store.
+
+        Returns:
+            SignalBatch with one row per signal.
+        """
+        items = list(signals)
+        n = len(items)
+
+        objs = np.empty(n, dtype=object)
+        objs[:] = items
+
+        return cls(
+            signals=objs,
+            names=np.array([s.name for s in items], dtype=object),
+            categories=pd.Categorical([s.category for s in items]),
+            strengths=pd.Categorical([s.strength for s in items]),
+            confidences=np.fromiter(
+                (s.confidence for s in items), dtype=np.float64, count=n
+            ),
+            timestamps=np.array(
+                [s.timestamp for s in items], dtype="datetime64[us]"
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Return number of signals in the batch."""
+        return len(self.signals)
+
+    def __getitem__(self, mask: Union[np.ndarray, slice]) -> SignalBatch:
+        """
+        Select rows by boolean mask, index array or slice.
+
+        Args:
+            mask: Row selector applied to every column.
+
+        Returns:
+            New SignalBatch with the selected rows.
+        """
+        return SignalBatch(
+            signals=self.signals[mask],
+            names=self.names[mask],
+            categories=self.categories[mask],
+            strengths=self.strengths[mask],
+            confidences=self.confidences[mask],
+            timestamps=self.timestamps[mask],
+        )
+
+    def to_list(self) -> List[Signal]:
+        """
+        Materialize the batch back into Signal objects.
+
+        Returns:
+            List of signals in batch order.
+        """
+        return self.signals.tolist()
+
+    # ============ FILTERS ============
+
+    def by_confidence(self, min_confidence: float) -> SignalBatch:
+        """
+        Keep signals at or above a confidence threshold.
+
+        Args:
+            min_confidence: Minimum confidence (0.0 to 1.0).
+
+        Returns:
+            Filtered batch.
+        """
+        return self[self.confidences >= min_confidence]
+
+    def by_category(self, category: str) -> SignalBatch:
+        """
+        Keep signals of a single category.
+
+        Args:
+            category: Category to match (e.g., 'MACD').
+
+        Returns:
+            Filtered batch.
+        """
+        return self[np.asarray(self.categories == category)]
+
+    def exclude_category(self, category: str) -> SignalBatch:
+        """
+        Drop signals of a single category.
+
+        Args:
+            category: Category to exclude.
+
+        Returns:
+            Filtered batch.
+        """
+        return self[np.asarray(self.categories != category)]
+
+    def by_strength(self, strength: str) -> SignalBatch:
+        """
+        Keep signals with an exact strength.
+
+        Args:
+            strength: Strength to match (e.g., 'BULLISH').
+
+        Returns:
+            Filtered batch.
+        """
+        return self[np.asarray(self.strengths == strength)]
+
+    def by_bullish(self) -> SignalBatch:
+        """Keep bullish signals only."""
+        return self[self.strengths.isin(list(SignalStrength.get_bullish_strengths()))]
+
+    def by_bearish(self) -> SignalBatch:
+        """Keep bearish signals only."""
+        return self[self.strengths.isin(list(SignalStrength.get_bearish_strengths()))]
+
+    # ============ ORDERING / GROUPING ============
+
+    def sort_by_confidence(self, ascending: bool = False) -> SignalBatch:
+        """
+        Sort by confidence (highest first by default).
+
+        Uses a stable sort so ties keep their incoming order, matching
+        `SignalSorter.by_confidence`.
+
+        Args:
+            ascending: Sort ascending if True.
+
+        Returns:
+            Sorted batch.
+        """
+        keys = self.confidences if ascending else -self.confidences
+        return self[np.argsort(keys, kind="stable")]
+
+    def group_by_category(self) -> Dict[str, SignalBatch]:
+        """
+        Group signals by category.
+
+        Returns:
+            Dictionary mapping category to its sub-batch.
+        """
+        codes = self.categories.codes
+        return {
+            category: self[codes == code]
+            for code, category in enumerate(self.categories.categories)
+            if (codes == code).any()
+        }
@@ -4,9 +4,8 @@ Signal filtering utilities.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
-import pandas as pd
 
 from signals.signal import Signal
 
@@ -126,5 +125,5 @@ class SignalFilter:
         Returns:
             Recent signals only.
         """
-        cutoff = datetime.now() - pd.Timedelta(seconds=max_age_seconds)
+        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
         return [s for s in signals if s.timestamp >= cutoff]
@@ -4,11 +4,29 @@ Signal sorting utilities.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from operator import attrgetter
 from typing import Dict, List
 
 from signals.signal import Signal
 
 
+_CONFIDENCE_KEY = attrgetter("confidence")
+_TIMESTAMP_KEY = attrgetter("timestamp")
+
+_STRENGTH_ORDER: Dict[str, int] = {
+    "EXTREME BULLISH": 0,
+    "STRONG BULLISH": 1,
+    "BULLISH": 2,
+    "MODERATE": 3,
+    "NEUTRAL": 4,
+    "BEARISH": 5,
+    "STRONG BEARISH": 6,
+    "EXTREME BEARISH": 7,
+}
+"""Sort rank per strength (strong bullish first, unknown last)."""
+
+
 class SignalSorter:
     """
     Sorts signals by various criteria.
@@ -26,7 +44,7 @@ class SignalSorter:
         Returns:
             Sorted list of signals.
         """
-        return sorted(signals, key=lambda s: s.confidence, reverse=not ascending)
+        return sorted(signals, key=_CONFIDENCE_KEY, reverse=not ascending)
 
     @staticmethod
     def by_timestamp(signals: List[Signal], ascending: bool = False) -> List[Signal]:
@@ -40,7 +58,7 @@ class SignalSorter:
         Returns:
             Sorted list of signals.
         """
-        return sorted(signals, key=lambda s: s.timestamp, reverse=not ascending)
+        return sorted(signals, key=_TIMESTAMP_KEY, reverse=not ascending)
 
     @staticmethod
     def by_strength(signals: List[Signal]) -> List[Signal]:
@@ -53,21 +71,8 @@ class SignalSorter:
         Returns:
             Sorted list with strong signals first.
         """
-        strength_order = {
-            "EXTREME BULLISH": 0,
-            "STRONG BULLISH": 1,
-            "BULLISH": 2,
-            "MODERATE": 3,
-            "NEUTRAL": 4,
-            "BEARISH": 5,
-            "STRONG BEARISH": 6,
-            "EXTREME BEARISH": 7,
-        }
-
-        return sorted(
-            signals,
-            key=lambda s: strength_order.get(s.strength, 99),
-        )
+        order = _STRENGTH_ORDER.get
+        return sorted(signals, key=lambda s: order(s.strength, 99))
 
     @staticmethod
     def by_category(signals: List[Signal]) -> Dict[str, List[Signal]]:
@@ -80,9 +85,7 @@ class SignalSorter:
         Returns:
             Dictionary mapping category to signals.
         """
-        grouped: Dict[str, List[Signal]] = {}
+        grouped: Dict[str, List[Signal]] = defaultdict(list)
         for signal in signals:
-            if signal.category not in grouped:
-                grouped[signal.category] = []
             grouped[signal.category].append(signal)
-        return grouped
+        return dict(grouped)
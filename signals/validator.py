@@ -4,12 +4,32 @@ Signal validation and quality control.
 Validates signal data, detects contradictions, and applies quality filters.
 """
 
-from typing import List, Set, Tuple
+from collections import defaultdict
+from itertools import compress
+from operator import attrgetter
+from typing import Any, Dict, List, Set, Tuple
+import numpy as np
+
 from signals.base import Signal, SignalStrength, SignalFilter
 from logging_config import get_logger
 
 logger = get_logger()
 
+# C-level attribute getters for building per-signal columns
+_STRENGTH = attrgetter("strength")
+_CONFIDENCE = attrgetter("confidence")
+
+# Strengths that earn the quality boost (all of them are directional)
+_BOOSTED_STRENGTHS = frozenset(
+    {
+        SignalStrength.STRONG_BULLISH,
+        SignalStrength.STRONG_BEARISH,
+        SignalStrength.EXTREME_BULLISH,
+        SignalStrength.EXTREME_BEARISH,
+    }
+)
+_BOOSTED_STRENGTHS_ARR = np.array(sorted(_BOOSTED_STRENGTHS), dtype=object)
+
 
 # ============ SIGNAL VALIDATOR ============
 
@@ -26,34 +46,41 @@ class SignalValidator:
     - Confidence is 0.0-1.0
     """
 
-    VALID_CATEGORIES = {
-        "MA_CROSS",
-        "MA_POSITION",
-        "MA_RIBBON",
-        "RSI",
-        "MACD",
-        "STOCHASTIC",
-        "ATR",
-        "ADX",
-        "VOLUME",
-        "FIBONACCI",
-        "PRICE_ACTION",
-        "VWAP",
-    }
-
-    VALID_STRENGTHS = {
-        SignalStrength.BULLISH,
-        SignalStrength.BEARISH,
-        SignalStrength.STRONG_BULLISH,
-        SignalStrength.STRONG_BEARISH,
-        SignalStrength.EXTREME_BULLISH,
-        SignalStrength.EXTREME_BEARISH,
-        SignalStrength.NEUTRAL,
-        SignalStrength.MODERATE,
-        SignalStrength.SIGNIFICANT,
-        SignalStrength.WEAK,
-        SignalStrength.TRENDING,
-    }
+    VALID_CATEGORIES = frozenset(
+        {
+            "MA_CROSS",
+            "MA_POSITION",
+            "MA_RIBBON",
+            "RSI",
+            "MACD",
+            "STOCHASTIC",
+            "ATR",
+            "ADX",
+            "VOLUME",
+            "FIBONACCI",
+            "PRICE_ACTION",
+            "VWAP",
+        }
+    )
+
+    VALID_STRENGTHS = frozenset(
+        {
+            SignalStrength.BULLISH,
+            SignalStrength.BEARISH,
+            SignalStrength.STRONG_BULLISH,
+            SignalStrength.STRONG_BEARISH,
+            SignalStrength.EXTREME_BULLISH,
+            SignalStrength.EXTREME_BEARISH,
+            SignalStrength.NEUTRAL,
+            SignalStrength.MODERATE,
+            SignalStrength.SIGNIFICANT,
+            SignalStrength.WEAK,
+            SignalStrength.TRENDING,
+        }
+    )
+
+    # Object array of valid strengths for vectorized membership tests
+    _VALID_STRENGTHS_ARR = np.array(sorted(VALID_STRENGTHS), dtype=object)
 
     @staticmethod
     def validate(signal: Signal) -> Tuple[bool, str]:
@@ -96,30 +123,79 @@ class SignalValidator:
 
         return True, ""
 
+    @staticmethod
+    def _is_numeric(value: Any) -> bool:
+        """Check that a signal value is None or convertible to float."""
+        if value is None:
+            return True
+        try:
+            float(value)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    @staticmethod
+    def _has_valid_fields(signal: Signal) -> bool:
+        """
+        Check the fields that cannot be tested column-wise.
+
+        Covers the required text fields and the numeric value; strength
+        and confidence are checked in bulk by `validate_batch`.
+        """
+        return (
+            bool(signal.name)
+            and isinstance(signal.name, str)
+            and bool(signal.category)
+            and isinstance(signal.category, str)
+            and bool(signal.description)
+            and isinstance(signal.description, str)
+            and SignalValidator._is_numeric(signal.value)
+        )
+
     @staticmethod
     def validate_batch(signals: List[Signal]) -> Tuple[List[Signal], int]:
         """
         Validate batch of signals, removing invalid ones.
 
+        Strength and confidence are checked for the whole batch at once
+        with numpy; the remaining field checks run per signal. Rejected
+        signals are re-run through `validate()` only to log the reason.
+
         Args:
             signals: List of signals to validate.
 
         Returns:
             Tuple of (valid_signals, invalid_count).
         """
-        valid = []
-        invalid_count = 0
+        n = len(signals)
+        if n == 0:
+            return [], 0
+
+        # Hoisted callables: C-level attribute getters and a local
+        # reference to the field check, so the per-signal passes do no
+        # attribute lookups on the class
+        has_valid_fields = SignalValidator._has_valid_fields
+
+        strengths = np.fromiter(map(_STRENGTH, signals), dtype=object, count=n)
+        confidences = np.fromiter(map(_CONFIDENCE, signals), dtype=np.float64, count=n)
+
+        ok = (
+            np.isin(strengths, SignalValidator._VALID_STRENGTHS_ARR)
+            & (confidences >= 0.0)
+            & (confidences <= 1.0)
+        )
+        ok &= np.fromiter(map(has_valid_fields, signals), dtype=bool, count=n)
 
-        for signal in signals:
-            is_valid, error = SignalValidator.validate(signal)
+        valid = list(compress(signals, ok.tolist()))
+        invalid_count = n - len(valid)
 
-            if is_valid:
-                valid.append(signal)
-            else:
-                invalid_count += 1
+        if invalid_count > 0:
+            validate = SignalValidator.validate
+            for i in np.flatnonzero(~ok):
+                signal = signals[i]
+                _, error = validate(signal)
                 logger.warning(f"Invalid signal removed: {signal.name} - {error}")
 
-        if invalid_count > 0:
             logger.info(f"Validation: removed {invalid_count} invalid signals")
 
         return valid, invalid_count
@@ -137,11 +213,51 @@ class ContradictionDetector:
     """
 
     # Categories that should not have both bullish and bearish signals
-    EXCLUSIVE_CATEGORIES = {
-        "MA_CROSS",
-        "MACD",
-        "PRICE_ACTION",
-    }
+    EXCLUSIVE_CATEGORIES = frozenset(
+        {
+            "MA_CROSS",
+            "MACD",
+            "PRICE_ACTION",
+        }
+    )
+
+    @staticmethod
+    def _has_exclusive(signals: List[Signal]) -> bool:
+        """Check whether any signal is in an exclusive category (short-circuits)."""
+        exclusive = ContradictionDetector.EXCLUSIVE_CATEGORIES
+        return any(signal.category in exclusive for signal in signals)
+
+    @staticmethod
+    def _direction_buckets(
+        signals: List[Signal],
+    ) -> Dict[str, Tuple[List[int], List[int]]]:
+        """
+        Group exclusive-category signal indices by direction.
+
+        Each signal's strength is classified once, in a single pass.
+
+        Args:
+            signals: List of signals to group.
+
+        Returns:
+            Category → (bullish indices, bearish indices), for exclusive
+            categories only. Neutral signals are left out.
+        """
+        exclusive = ContradictionDetector.EXCLUSIVE_CATEGORIES
+        buckets: Dict[str, Tuple[List[int], List[int]]] = defaultdict(
+            lambda: ([], [])
+        )
+
+        for i, signal in enumerate(signals):
+            if signal.category not in exclusive:
+                continue
+
+            if SignalStrength.is_bullish(signal.strength):
+                buckets[signal.category][0].append(i)
+            elif SignalStrength.is_bearish(signal.strength):
+                buckets[signal.category][1].append(i)
+
+        return buckets
 
     @staticmethod
     def detect_contradictions(signals: List[Signal]) -> List[Tuple[int, int, str]]:
@@ -154,41 +270,28 @@ class ContradictionDetector:
         Returns:
             List of tuples (index1, index2, reason) for contradictions.
         """
+        if not ContradictionDetector._has_exclusive(signals):
+            return []
+
         contradictions = []
 
-        # Group signals by category
-        by_category = {}
-        for i, signal in enumerate(signals):
-            if signal.category not in by_category:
-                by_category[signal.category] = []
-            by_category[signal.category].append((i, signal))
+        buckets = ContradictionDetector._direction_buckets(signals)
 
-        # Check each exclusive category
-        for category in ContradictionDetector.EXCLUSIVE_CATEGORIES:
-            if category not in by_category:
+        # Check each exclusive category for both bullish and bearish
+        for category, (bullish, bearish) in buckets.items():
+            if not (bullish and bearish):
                 continue
 
-            signals_in_cat = by_category[category]
-
-            # Check for both bullish and bearish
-            bullish = [
-                (i, s) for i, s in signals_in_cat if SignalStrength.is_bullish(s.strength)
-            ]
-            bearish = [
-                (i, s) for i, s in signals_in_cat if SignalStrength.is_bearish(s.strength)
-            ]
-
-            if bullish and bearish:
-                # Both bullish and bearish signals exist
-                for bull_idx, bull_signal in bullish:
-                    for bear_idx, bear_signal in bearish:
-                        contradictions.append(
-                            (
-                                bull_idx,
-                                bear_idx,
-                                f"Contradicting {category} signals: {bull_signal.name} vs {bear_signal.name}",
-                            )
+            for bull_idx in bullish:
+                for bear_idx in bearish:
+                    contradictions.append(
+                        (
+                            bull_idx,
+                            bear_idx,
+                            f"Contradicting {category} signals: "
+                            f"{signals[bull_idx].name} vs {signals[bear_idx].name}",
                         )
+                    )
 
         return contradictions
 
@@ -237,6 +340,54 @@ class ContradictionDetector:
 
         return result
 
+    @staticmethod
+    def resolve_contradictions_fast(signals: List[Signal]) -> List[Signal]:
+        """
+        Resolve contradictions without enumerating signal pairs.
+
+        Gives the same result as `resolve_contradictions` with
+        'remove_lower_confidence', in O(n) instead of O(bullish × bearish)
+        per category: a bearish signal loses to any bullish signal at least
+        as confident, and a bullish signal loses to any strictly more
+        confident bearish one, so only the best confidence on each side
+        matters.
+
+        Args:
+            signals: List of signals.
+
+        Returns:
+            Signals with contradictions resolved.
+        """
+        if not ContradictionDetector._has_exclusive(signals):
+            return signals
+
+        buckets = ContradictionDetector._direction_buckets(signals)
+
+        to_remove: Set[int] = set()
+        n_contradictions = 0
+
+        for bullish, bearish in buckets.values():
+            if not (bullish and bearish):
+                continue
+
+            n_contradictions += len(bullish) * len(bearish)
+            best_bull = max(signals[i].confidence for i in bullish)
+            best_bear = max(signals[i].confidence for i in bearish)
+
+            to_remove.update(i for i in bearish if signals[i].confidence <= best_bull)
+            to_remove.update(i for i in bullish if signals[i].confidence < best_bear)
+
+        if not to_remove:
+            return signals
+
+        logger.info(f"Resolving {n_contradictions} signal contradictions")
+
+        result = [s for i, s in enumerate(signals) if i not in to_remove]
+
+        logger.info(f"Removed {len(to_remove)} contradictory signals")
+
+        return result
+
 
 # ============ SIGNAL QUALITY SCORER ============
 
@@ -265,28 +416,58 @@ class QualityScorer:
         Returns:
             Quality score (0.0 to 1.0).
         """
-        score = signal.confidence  # Start with base confidence
+        delta = 0.0  # Adjustments to base confidence, clamped once at the end
 
         # Boost for strong signals
-        if SignalStrength.is_bullish(signal.strength) or SignalStrength.is_bearish(
-            signal.strength
-        ):
-            if "STRONG" in signal.strength or "EXTREME" in signal.strength:
-                score = min(1.0, score + 0.1)
+        if signal.strength in _BOOSTED_STRENGTHS:
+            delta += 0.1
 
         # Boost for signals with details
         if signal.details:
-            score = min(1.0, score + 0.05)
+            delta += 0.05
 
         # Boost for signals with trading implication
         if signal.trading_implication:
-            score = min(1.0, score + 0.05)
+            delta += 0.05
 
         # Slight penalty for neutral signals
         if signal.is_neutral():
-            score = max(0.0, score - 0.1)
+            delta -= 0.1
+
+        return max(0.0, min(1.0, signal.confidence + delta))
+
+    @staticmethod
+    def _score_batch_vectorized(signals: List[Signal]) -> np.ndarray:
+        """
+        Score a batch of signals as one numpy array.
+
+        Same rules as `score_signal`, applied column-wise. Adjustments are
+        summed in the same order as the scalar version and clamped once,
+        so the scores match exactly.
 
-        return score
+        Args:
+            signals: List of signals to score.
+
+        Returns:
+            float64 array of quality scores aligned with `signals`.
+        """
+        n = len(signals)
+        score = np.fromiter(map(_CONFIDENCE, signals), dtype=np.float64, count=n)
+        strengths = np.fromiter(map(_STRENGTH, signals), dtype=object, count=n)
+
+        boosted = np.isin(strengths, _BOOSTED_STRENGTHS_ARR)
+        has_details = np.fromiter((bool(s.details) for s in signals), dtype=bool, count=n)
+        has_implication = np.fromiter(
+            (bool(s.trading_implication) for s in signals), dtype=bool, count=n
+        )
+        neutral = strengths == SignalStrength.NEUTRAL
+
+        delta = np.where(boosted, 0.1, 0.0)
+        delta += np.where(has_details, 0.05, 0.0)
+        delta += np.where(has_implication, 0.05, 0.0)
+        delta -= np.where(neutral, 0.1, 0.0)
+
+        return np.clip(score + delta, 0.0, 1.0)
 
     @staticmethod
     def score_batch(signals: List[Signal]) -> List[Tuple[Signal, float]]:
@@ -299,7 +480,8 @@ class QualityScorer:
         Returns:
             List of (signal, score) tuples.
         """
-        return [(signal, QualityScorer.score_signal(signal)) for signal in signals]
+        scores = QualityScorer._score_batch_vectorized(signals)
+        return list(zip(signals, scores.tolist()))
 
     @staticmethod
     def filter_by_quality(
@@ -315,8 +497,8 @@ class QualityScorer:
         Returns:
             Filtered signals meeting quality threshold.
         """
-        scored = QualityScorer.score_batch(signals)
-        filtered = [signal for signal, score in scored if score >= min_quality]
+        scores = QualityScorer._score_batch_vectorized(signals)
+        filtered = list(compress(signals, (scores >= min_quality).tolist()))
 
         if len(filtered) < len(signals):
             logger.info(
@@ -366,9 +548,12 @@ class SignalQualityPipeline:
             signals: List of signals to process.
 
         Returns:
-            Quality-controlled signals.
+            Quality-controlled signals. Every stage builds a new list when
+            it drops anything, so the input is never modified; if no
+            stage runs or removes a signal, the input list itself is
+            returned.
         """
-        result = signals.copy()
+        result = signals
 
         logger.debug(f"Processing {len(result)} signals through quality pipeline")
 
@@ -379,9 +564,7 @@ class SignalQualityPipeline:
 
         # Step 2: Resolve contradictions
         if self.resolve_contradictions:
-            result = ContradictionDetector.resolve_contradictions(
-                result, resolution="remove_lower_confidence"
-            )
+            result = ContradictionDetector.resolve_contradictions_fast(result)
 
         # Step 3: Score and filter by quality
         if self.score_quality:
@@ -17,6 +17,7 @@ from typing import (
     Set,
     Tuple,
     TypedDict,
+    TypeVar,
     Union,
 )
 from datetime import datetime
@@ -312,12 +313,16 @@ class PipelineResult(TypedDict, total=False):
 
 # ============ GENERIC TYPES ============
 
-T = TypeVar = None  # Placeholder for generic types
+T = TypeVar("T")
 """Generic type variable (use in function definitions)."""
 
 
 # ============ USEFUL TYPE COMBINATIONS ============
 
+# Accepted timeframes, built once at import
+_VALID_TF = frozenset(("1m", "2m", "5m", "15m", "30m", "1h", "1d", "1wk", "1mo"))
+
+
 def is_valid_price(value: Any) -> bool:
     """Check if value is a valid price."""
     return isinstance(value, (int, float)) and not (
@@ -327,15 +332,17 @@ def is_valid_price(value: Any) -> bool:
 
 def is_valid_volume(value: Any) -> bool:
     """Check if value is valid volume."""
-    return isinstance(value, (int, float)) and value >= 0 and int(value) == value
+    if isinstance(value, (int, np.integer)):
+        return bool(value >= 0)
+    return isinstance(value, float) and value >= 0 and value.is_integer()
 
 
 def is_valid_symbol(symbol: Any) -> bool:
     """Check if value is valid stock symbol."""
-    return isinstance(symbol, str) and len(symbol) > 0 and symbol.isalpha()
+    # ASCII letters only; isalpha() alone also accepts non-Latin scripts
+    return isinstance(symbol, str) and symbol.isascii() and symbol.isalpha()
 
 
 def is_valid_timeframe(timeframe: Any) -> bool:
     """Check if value is valid timeframe."""
-    valid_tf = ["1m", "2m", "5m", "15m", "30m", "1h", "1d", "1wk", "1mo"]
-    return isinstance(timeframe, str) and timeframe in valid_tf
\ No newline at end of file
+    return isinstance(timeframe, str) and timeframe in _VALID_TF
\ No newline at end of file